@@ -38,6 +38,7 @@ SUBJECT_AREAS = (
     "Human Sciences",
     "Linguistics, Letters and Arts",
 )
+_VALID_SUBJECT_AREAS = frozenset(SUBJECT_AREAS)
 
 MAX_RETRIES = int(os.environ.get("KERNEL_LIB_MAX_RETRIES", "4"))
 BACKOFF_FACTOR = float(os.environ.get("KERNEL_LIB_BACKOFF_FACTOR", "1.2"))
@@ -52,7 +53,7 @@ OBJECTSTORE_REQUEST_FAILURES_TOTAL = Counter(
 
 
 def utcnow():
-    return str(datetime.utcnow().isoformat() + "Z")
+    return datetime.utcnow().isoformat() + "Z"
 
 
 class DocumentManifest:
@@ -328,10 +329,30 @@ def _display_format_convert_bold_and_italic(node):
             found.tag = tag[0]
 
 
+def _bisect_right_by(entries: list, timestamp: str, key: Callable) -> int:
+    """Equivalente a `bisect.bisect_right` sobre as chaves obtidas por `key`
+    de cada item de `entries`, sem que seja necessário extraí-las previamente.
+    `entries` deve estar em ordem cronológica. Os timestamps UTC ISO 8601 são
+    comparados como strings, já que a ordem lexicográfica coincide com a
+    temporal.
+    """
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if timestamp < key(entries[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
 class Document:
+    __slots__ = ("_manifest",)
     _timestamp_pattern = (
         r"^[0-9]{4}-[0-9]{2}-[0-9]{2}(T[0-9]{2}:[0-9]{2}(:[0-9]{2})?Z)?$"
     )
+    _timestamp_regex = re.compile(_timestamp_pattern)
+    _date_only_regex = re.compile(r"^\d{4}-\d{2}-\d{2}$")
     data_type = "text/xml"
 
     def __init__(self, id=None, manifest=None):
@@ -347,7 +368,7 @@ class Document:
         self._manifest = value
 
     def id(self):
-        return self.manifest.get("id", "")
+        return self._manifest.get("id", "")
 
     def new_version(
         self, data_url, assets_getter=assets_from_remote_xml, timeout=2, ensure_unique_name=False
@@ -387,7 +408,7 @@ class Document:
 
     def version(self, index=-1) -> dict:
         try:
-            version = self.manifest["versions"][index]
+            version = deepcopy(self._manifest["versions"][index])
         except IndexError:
             raise ValueError("missing version for index: %s" % index) from None
 
@@ -432,51 +453,39 @@ class Document:
         para o nível dos microsegundos por meio da concatenação da string
         `T23:59:59:999999Z` ao valor de `timestamp`.
         """
-        if not re.match(self._timestamp_pattern, timestamp):
+        if not self._timestamp_regex.match(timestamp):
             raise ValueError(
                 "invalid format for timestamp: %s: must match pattern: %s"
                 % (timestamp, self._timestamp_pattern)
             )
 
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", timestamp):
+        if self._date_only_regex.match(timestamp):
             timestamp = f"{timestamp}T23:59:59.999999Z"
 
-        try:
-            target_version = max(
-                itertools.takewhile(
-                    lambda version: version.get("timestamp", "") <= timestamp,
-                    self.manifest["versions"],
-                ),
-                key=lambda version: version.get("timestamp", ""),
-            )
-        except ValueError:
-            raise ValueError("missing version for timestamp: %s" %
-                             timestamp) from None
+        versions = self._manifest["versions"]
+        position = _bisect_right_by(
+            versions, timestamp, key=lambda version: version.get("timestamp", "")
+        )
+        if position == 0:
+            raise ValueError("missing version for timestamp: %s" % timestamp)
+        target_version = deepcopy(versions[position - 1])
 
         if target_version.get("deleted"):
             return target_version
 
         def _at_time(uris):
-            try:
-                target = max(
-                    itertools.takewhile(
-                        lambda asset: asset[0] <= timestamp, uris),
-                    key=lambda asset: asset[0],
-                )
-            except ValueError:
+            position = _bisect_right_by(uris, timestamp, key=lambda asset: asset[0])
+            if position == 0:
                 return ""
-            return target[1]
+            return uris[position - 1][1]
 
         def _rendition_at_time(r):
-            try:
-                target_data = max(
-                    itertools.takewhile(
-                        lambda r_data: r_data["timestamp"] <= timestamp, r["data"]
-                    ),
-                    key=lambda r_data: r_data["timestamp"],
-                )
-            except ValueError:
+            position = _bisect_right_by(
+                r["data"], timestamp, key=lambda r_data: r_data["timestamp"]
+            )
+            if position == 0:
                 return {}
+            target_data = r["data"][position - 1]
             rendition = {
                 "filename": r["filename"],
                 "mimetype": r["mimetype"],
@@ -663,46 +672,67 @@ class BundleManifest:
                 return item
 
     @staticmethod
-    def add_item(bundle: dict, item: dict, now: Callable[[], str] = utcnow) -> dict:
-
+    def _coerce_item(item: dict, action: str) -> Tuple[dict, str]:
         try:
             _item = dict(item)
             _id = _item["id"]
         except ValueError:
             raise ValueError(
-                "cannot add this item " '"%s": item must be dict' % item
+                "cannot %s this item " '"%s": item must be dict' % (action, item)
             ) from None
         except KeyError:
             raise KeyError(
-                "cannot add this item " '"%s": item must contain id key' % item
+                "cannot %s this item " '"%s": item must contain id key' % (action, item)
             ) from None
+        return _item, _id
+
+    @staticmethod
+    def _item_already_exists(_id: str) -> exceptions.AlreadyExists:
+        return exceptions.AlreadyExists(
+            'cannot add item "%s" in bundle: ' "the item id already exists" % _id
+        )
+
+    @staticmethod
+    def add_item(bundle: dict, item: dict, now: Callable[[], str] = utcnow) -> dict:
+        _item, _id = BundleManifest._coerce_item(item, "add")
 
         if BundleManifest.get_item(bundle, _id) is not None:
-            raise exceptions.AlreadyExists(
-                'cannot add item "%s" in bundle: ' "the item id already exists" % _id
-            )
+            raise BundleManifest._item_already_exists(_id)
 
         _bundle = deepcopy(bundle)
         _bundle["items"].append(_item)
         _bundle["updated"] = now()
         return _bundle
 
+    @staticmethod
+    def add_items(
+        bundle: dict, items: List[dict], now: Callable[[], str] = utcnow
+    ) -> dict:
+        """Adiciona `items` ao final de `bundle`, na ordem em que são dados.
+        Cada item é validado como em `add_item`, mas `bundle` é copiado e
+        `updated` é atualizado uma única vez. Todos os itens são verificados
+        antes da cópia, então, caso algum seja inválido ou já exista, nenhum é
+        adicionado.
+        """
+        known_ids = {item["id"] for item in bundle["items"]}
+        _items = []
+        for item in items:
+            _item, _id = BundleManifest._coerce_item(item, "add")
+            if _id in known_ids:
+                raise BundleManifest._item_already_exists(_id)
+            known_ids.add(_id)
+            _items.append(_item)
+
+        _bundle = deepcopy(bundle)
+        _bundle["items"].extend(_items)
+        _bundle["updated"] = now()
+        return _bundle
+
     @staticmethod
     def insert_item(
         bundle: dict, index: int, item: dict, now: Callable[[], str] = utcnow
     ) -> dict:
-
-        try:
-            _item = dict(item)
-            _id = _item["id"]
-        except ValueError:
-            raise ValueError(
-                "cannot insert this item " '"%s": item must be dict' % item
-            ) from None
-        except KeyError:
-            raise KeyError(
-                "cannot insert this item " '"%s": item must contain id key' % item
-            ) from None
+        _item, _id = BundleManifest._coerce_item(item, "insert")
 
         if BundleManifest.get_item(bundle, _id) is not None:
             raise exceptions.AlreadyExists(
@@ -719,15 +749,16 @@ class BundleManifest:
         bundle: dict, item_id: str, now: Callable[[], str] = utcnow
     ) -> dict:
 
-        item = BundleManifest.get_item(bundle, item_id)
-
-        if item is None:
+        for index, item in enumerate(bundle["items"]):
+            if item_id == item["id"]:
+                break
+        else:
             raise exceptions.DoesNotExist(
                 "cannot remove item from bundle: "
                 'the item id "%s" does not exist' % item_id
             )
         _bundle = deepcopy(bundle)
-        _bundle["items"].remove(item)
+        del _bundle["items"][index]
         _bundle["updated"] = now()
         return _bundle
 
@@ -772,7 +803,7 @@ class DocumentsBundle:
         self.manifest = manifest or BundleManifest.new(id)
 
     def id(self):
-        return self.manifest.get("id", "")
+        return self._manifest.get("id", "")
 
     def data(self):
         return self.manifest
@@ -792,7 +823,7 @@ class DocumentsBundle:
 
     @property
     def publication_year(self):
-        return BundleManifest.get_metadata(self.manifest, "publication_year")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "publication_year"))
 
     @publication_year.setter
     def publication_year(self, value: Union[str, int]):
@@ -808,7 +839,9 @@ class DocumentsBundle:
 
     @property
     def publication_months(self):
-        return BundleManifest.get_metadata(self.manifest, "publication_months", {})
+        return deepcopy(
+            BundleManifest.get_metadata(self._manifest, "publication_months", {})
+        )
 
     @publication_months.setter
     def publication_months(self, value: Dict):
@@ -826,7 +859,7 @@ class DocumentsBundle:
 
     @property
     def volume(self):
-        return BundleManifest.get_metadata(self.manifest, "volume")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "volume"))
 
     @volume.setter
     def volume(self, value: Union[str, int]):
@@ -836,7 +869,7 @@ class DocumentsBundle:
 
     @property
     def pid(self):
-        return BundleManifest.get_metadata(self.manifest, "pid")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "pid"))
 
     @pid.setter
     def pid(self, value: str):
@@ -846,7 +879,7 @@ class DocumentsBundle:
 
     @property
     def number(self):
-        return BundleManifest.get_metadata(self.manifest, "number")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "number"))
 
     @number.setter
     def number(self, value: Union[str, int]):
@@ -856,7 +889,7 @@ class DocumentsBundle:
 
     @property
     def supplement(self):
-        return BundleManifest.get_metadata(self.manifest, "supplement")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "supplement"))
 
     @supplement.setter
     def supplement(self, value: Union[str, int]):
@@ -867,12 +900,12 @@ class DocumentsBundle:
 
     @property
     def titles(self):
-        return BundleManifest.get_metadata(self.manifest, "titles", [])
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "titles", []))
 
     @titles.setter
     def titles(self, value: dict):
         try:
-            _value = list([dict(title) for title in value])
+            _value = [dict(title) for title in value]
         except (TypeError, ValueError):
             raise TypeError(
                 "cannot set titles with value "
@@ -893,7 +926,7 @@ class DocumentsBundle:
 
     @property
     def documents(self):
-        return self.manifest["items"]
+        return deepcopy(self._manifest["items"])
 
 
 class Journal:
@@ -909,13 +942,13 @@ class Journal:
         self.manifest = manifest or BundleManifest.new(id)
 
     def id(self):
-        return self.manifest.get("id", "")
+        return self._manifest.get("id", "")
 
     def created(self):
-        return self.manifest.get("created", "")
+        return self._manifest.get("created", "")
 
     def updated(self):
-        return self.manifest.get("updated", "")
+        return self._manifest.get("updated", "")
 
     @property
     def manifest(self):
@@ -936,12 +969,12 @@ class Journal:
 
     @property
     def mission(self):
-        return BundleManifest.get_metadata(self.manifest, "mission", [])
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "mission", []))
 
     @mission.setter
     def mission(self, value: List[dict]):
         try:
-            value = list([dict(mission) for mission in value])
+            value = [dict(mission) for mission in value]
         except (TypeError, ValueError):
             raise TypeError(
                 "cannot set mission with value "
@@ -952,7 +985,7 @@ class Journal:
 
     @property
     def title(self):
-        return BundleManifest.get_metadata(self.manifest, "title")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "title"))
 
     @title.setter
     def title(self, value: str):
@@ -962,7 +995,7 @@ class Journal:
 
     @property
     def title_iso(self):
-        return BundleManifest.get_metadata(self.manifest, "title_iso")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "title_iso"))
 
     @title_iso.setter
     def title_iso(self, value: str):
@@ -972,7 +1005,7 @@ class Journal:
 
     @property
     def short_title(self):
-        return BundleManifest.get_metadata(self.manifest, "short_title")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "short_title"))
 
     @short_title.setter
     def short_title(self, value: str):
@@ -983,7 +1016,7 @@ class Journal:
 
     @property
     def acronym(self):
-        return BundleManifest.get_metadata(self.manifest, "acronym")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "acronym"))
 
     @acronym.setter
     def acronym(self, value: str):
@@ -993,7 +1026,7 @@ class Journal:
 
     @property
     def scielo_issn(self):
-        return BundleManifest.get_metadata(self.manifest, "scielo_issn")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "scielo_issn"))
 
     @scielo_issn.setter
     def scielo_issn(self, value: str):
@@ -1004,7 +1037,7 @@ class Journal:
 
     @property
     def print_issn(self):
-        return BundleManifest.get_metadata(self.manifest, "print_issn")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "print_issn"))
 
     @print_issn.setter
     def print_issn(self, value: str):
@@ -1015,7 +1048,7 @@ class Journal:
 
     @property
     def electronic_issn(self):
-        return BundleManifest.get_metadata(self.manifest, "electronic_issn")
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "electronic_issn"))
 
     @electronic_issn.setter
     def electronic_issn(self, value: str):
@@ -1026,7 +1059,9 @@ class Journal:
 
     @property
     def status_history(self):
-        return BundleManifest.get_metadata(self.manifest, "status_history", [])
+        return deepcopy(
+            BundleManifest.get_metadata(self._manifest, "status_history", [])
+        )
 
     @status_history.setter
     def status_history(self, value: list):
@@ -1043,7 +1078,9 @@ class Journal:
 
     @property
     def subject_areas(self):
-        return BundleManifest.get_metadata(self.manifest, "subject_areas", [])
+        return deepcopy(
+            BundleManifest.get_metadata(self._manifest, "subject_areas", [])
+        )
 
     @subject_areas.setter
     def subject_areas(self, value: tuple):
@@ -1054,7 +1091,11 @@ class Journal:
                 "cannot set subject_areas with value "
                 '"%s": value must be tuple' % repr(value)
             ) from None
-        invalid = [item for item in value if item not in SUBJECT_AREAS]
+        invalid = [
+            item
+            for item in value
+            if not isinstance(item, str) or item not in _VALID_SUBJECT_AREAS
+        ]
         if invalid:
             raise ValueError(
                 "cannot set subject_areas with value %s: " % repr(value)
@@ -1066,7 +1107,7 @@ class Journal:
 
     @property
     def sponsors(self) -> Tuple[dict]:
-        return BundleManifest.get_metadata(self.manifest, "sponsors", [])
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "sponsors", []))
 
     @sponsors.setter
     def sponsors(self, value: Tuple[dict]) -> None:
@@ -1081,7 +1122,7 @@ class Journal:
 
     @property
     def metrics(self):
-        return BundleManifest.get_metadata(self.manifest, "metrics", {})
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "metrics", {}))
 
     @metrics.setter
     def metrics(self, value: dict):
@@ -1096,7 +1137,9 @@ class Journal:
 
     @property
     def subject_categories(self):
-        return BundleManifest.get_metadata(self.manifest, "subject_categories", [])
+        return deepcopy(
+            BundleManifest.get_metadata(self._manifest, "subject_categories", [])
+        )
 
     @subject_categories.setter
     def subject_categories(self, value: Union[list, tuple]):
@@ -1114,8 +1157,10 @@ class Journal:
 
     @property
     def institution_responsible_for(self):
-        return BundleManifest.get_metadata(
-            self.manifest, "institution_responsible_for", ()
+        return deepcopy(
+            BundleManifest.get_metadata(
+                self._manifest, "institution_responsible_for", ()
+            )
         )
 
     @institution_responsible_for.setter
@@ -1129,12 +1174,14 @@ class Journal:
             ) from None
 
         self.manifest = BundleManifest.set_metadata(
-            self.manifest, "institution_responsible_for", value
+            self._manifest, "institution_responsible_for", value
         )
 
     @property
     def online_submission_url(self):
-        return BundleManifest.get_metadata(self.manifest, "online_submission_url")
+        return deepcopy(
+            BundleManifest.get_metadata(self._manifest, "online_submission_url")
+        )
 
     @online_submission_url.setter
     def online_submission_url(self, value: str):
@@ -1145,7 +1192,7 @@ class Journal:
 
     @property
     def next_journal(self):
-        return BundleManifest.get_metadata(self.manifest, "next_journal", {})
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "next_journal", {}))
 
     @next_journal.setter
     def next_journal(self, value: dict):
@@ -1162,7 +1209,9 @@ class Journal:
 
     @property
     def previous_journal(self):
-        return BundleManifest.get_metadata(self.manifest, "previous_journal", {})
+        return deepcopy(
+            BundleManifest.get_metadata(self._manifest, "previous_journal", {})
+        )
 
     @previous_journal.setter
     def previous_journal(self, value: dict):
@@ -1179,7 +1228,7 @@ class Journal:
 
     @property
     def contact(self) -> dict:
-        return BundleManifest.get_metadata(self.manifest, "contact", {})
+        return deepcopy(BundleManifest.get_metadata(self._manifest, "contact", {}))
 
     @contact.setter
     def contact(self, value: dict) -> None:
@@ -1198,6 +1247,12 @@ class Journal:
     def add_issue(self, issue: str) -> None:
         self.manifest = BundleManifest.add_item(self._manifest, issue)
 
+    def add_issues(self, issues: List[dict]) -> None:
+        """Adiciona todos os `issues`, na ordem em que são dados. Caso algum
+        deles seja inválido ou já exista, nenhum é adicionado.
+        """
+        self.manifest = BundleManifest.add_items(self._manifest, issues)
+
     def insert_issue(self, index: int, issue: str) -> None:
         self.manifest = BundleManifest.insert_item(
             self._manifest, index, issue)
@@ -1207,11 +1262,11 @@ class Journal:
 
     @property
     def issues(self) -> List[str]:
-        return self.manifest["items"]
+        return deepcopy(self._manifest["items"])
 
     @property
     def provisional(self):
-        return BundleManifest.get_component(self.manifest, "provisional")
+        return deepcopy(BundleManifest.get_component(self._manifest, "provisional"))
 
     @provisional.setter
     def provisional(self, provisional: str) -> None:
@@ -1221,7 +1276,7 @@ class Journal:
 
     @property
     def ahead_of_print_bundle(self) -> str:
-        return BundleManifest.get_component(self.manifest, "aop", "")
+        return deepcopy(BundleManifest.get_component(self._manifest, "aop", ""))
 
     @ahead_of_print_bundle.setter
     def ahead_of_print_bundle(self, value: str) -> None:
@@ -1,3 +1,5 @@
+import bisect
+import itertools
 from collections import OrderedDict
 
 import pymongo
@@ -185,6 +187,12 @@ class InMemoryChangesDataStore(interfaces.ChangesDataStore):
         self._timestamps = OrderedDict()  # timestamps -> mudanças
         self._ids = {}  # ids -> mudanças
 
+    def reset(self):
+        """Remove todas as mudanças, permitindo o reuso da instância.
+        """
+        self._timestamps.clear()
+        self._ids.clear()
+
     def add(self, change: dict):
         change["_id"] = str(change.get("_id") or ObjectId())
         if change["timestamp"] in self._timestamps or change["_id"] in self._ids:
@@ -209,9 +217,12 @@ class InMemoryChangesDataStore(interfaces.ChangesDataStore):
 
 
 class MongoDBCollectionStub:
+    __slots__ = ("_mongo_store", "_timestamps", "_keys")
+
     def __init__(self):
         self._mongo_store = OrderedDict()
-        self._timestamps = set()  # devem ser únicos
+        self._timestamps = {}  # devem ser únicos
+        self._keys = []  # timestamps ordenados, para a busca binária em `find`
 
     def insert_one(self, data):
         if "_id" not in data:
@@ -221,20 +232,16 @@ class MongoDBCollectionStub:
             raise pymongo.errors.DuplicateKeyError("")
         else:
             self._mongo_store[data["_id"]] = data
-            self._timestamps.add(data["timestamp"])
+            self._timestamps[data["timestamp"]] = data
+            bisect.insort(self._keys, data["timestamp"])
 
     def find(self, query, sort=None, projection=None):
         since = query["timestamp"]["$gt"]
-
-        first = 0
-        for i, change_key in enumerate(self._mongo_store):
-            if self._mongo_store[change_key]["timestamp"] <= since:
-                continue
-            else:
-                first = i
-                break
-
-        return SliceResultStub(list(self._mongo_store.values())[first:])
+        first = bisect.bisect_right(self._keys, since)
+        return SliceResultStub(
+            self._timestamps[timestamp]
+            for timestamp in itertools.islice(self._keys, first, None)
+        )
 
     def find_one(self, query):
         change_id = query["_id"]
@@ -244,12 +251,22 @@ class MongoDBCollectionStub:
             return None
 
 
+class MongoClientStub:
+    """Substituto de `adapters.MongoDB` para os casos em que as coleções não
+    são acessadas.
+    """
+
+    documents = documents_bundles = journals = changes = None
+
+
 class SliceResultStub:
+    __slots__ = ("_data",)
+
     def __init__(self, data):
         self._data = data
 
     def limit(self, val):
-        return self._data[:val]
+        return list(itertools.islice(self._data, val))
 
 
 def journal_registry_fixture(sufix="", subject_areas=["Agricultural Sciences"]):
@@ -1,17 +1,67 @@
+import contextlib
 import json
+import logging
 import unittest
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch, PropertyMock
 
+import pymongo
+import pymongo.errors
+from bson.objectid import ObjectId
+
 from documentstore import adapters, domain, exceptions, interfaces
 from . import apptesting
 
 
+class _StubCollection:
+    """Substituto mínimo de `pymongo.collection.Collection` que registra apenas
+    as chamadas necessárias às asserções de `StoreTestMixin`.
+    """
+
+    __slots__ = (
+        "insert_one_calls",
+        "insert_one_exc",
+        "find_one_calls",
+        "find_one_ret",
+        "replace_one_calls",
+        "replace_one_ret",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Restaura o estado inicial, permitindo o reuso da instância entre
+        testes.
+        """
+        self.insert_one_calls = []
+        self.insert_one_exc = None
+        self.find_one_calls = []
+        self.find_one_ret = None
+        self.replace_one_calls = []
+        self.replace_one_ret = SimpleNamespace(matched_count=1)
+
+    def insert_one(self, document, **kwargs):
+        self.insert_one_calls.append(document)
+        if self.insert_one_exc is not None:
+            raise self.insert_one_exc
+
+    def find_one(self, query, **kwargs):
+        self.find_one_calls.append(query)
+        return self.find_one_ret
+
+    def replace_one(self, query, document, **kwargs):
+        self.replace_one_calls.append((query, document))
+        return self.replace_one_ret
+
+
 class StoreTestMixin:
+    @classmethod
+    def setUpClass(cls):
+        cls.DBCollectionMock = _StubCollection()
+
     def setUp(self):
-        self.DBCollectionMock = Mock()
-        self.DBCollectionMock.insert_one = Mock()
-        self.DBCollectionMock.find_one = Mock()
-        self.DBCollectionMock.replace_one = Mock()
+        self.DBCollectionMock.reset()
 
     def test_add(self):
         manifest = apptesting.manifest_data_fixture()
@@ -20,8 +70,8 @@ class StoreTestMixin:
         store.add(data)
         expected = data.manifest
         expected["_id"] = "0034-8910-rsp-48-2"
-        self.DBCollectionMock.insert_one.assert_called_once_with(
-            self.set_expected(expected)
+        self.assertEqual(
+            self.DBCollectionMock.insert_one_calls, [self.set_expected(expected)]
         )
 
     def test_add_data_with_divergent_ids(self):
@@ -29,37 +79,33 @@ class StoreTestMixin:
         data = self.DomainClass(manifest={"_id": "1", "id": "0034-8910-rsp-48-2"})
         store.add(data)
         expected = data.manifest
-        self.DBCollectionMock.insert_one.assert_called_once_with(
-            self.set_expected(expected)
+        self.assertEqual(
+            self.DBCollectionMock.insert_one_calls, [self.set_expected(expected)]
         )
 
     def test_add_raises_exception_if_already_exists(self):
-        import pymongo
-
-        self.DBCollectionMock.insert_one.side_effect = pymongo.errors.DuplicateKeyError(
-            ""
-        )
+        self.DBCollectionMock.insert_one_exc = pymongo.errors.DuplicateKeyError("")
         store = self.Adapter(self.DBCollectionMock)
         data = self.DomainClass(id="0034-8910-rsp-48-2")
         self.assertRaises(exceptions.AlreadyExists, store.add, data)
 
     def test_fetch_raises_exception_if_does_not_exist(self):
-        self.DBCollectionMock.find_one.return_value = None
+        self.DBCollectionMock.find_one_ret = None
         store = self.Adapter(self.DBCollectionMock)
         self.assertRaises(exceptions.DoesNotExist, store.fetch, "0034-8910-rsp-48-2")
 
     def test_fetch(self):
         manifest = apptesting.manifest_data_fixture()
-        self.DBCollectionMock.find_one.return_value = self.set_expected(manifest)
+        self.DBCollectionMock.find_one_ret = self.set_expected(manifest)
         store = self.Adapter(self.DBCollectionMock)
         store.fetch("0034-8910-rsp-48-2")
-        self.DBCollectionMock.find_one.assert_called_once_with(
-            {"_id": "0034-8910-rsp-48-2"}
+        self.assertEqual(
+            self.DBCollectionMock.find_one_calls, [{"_id": "0034-8910-rsp-48-2"}]
         )
 
     def test_fetch_returns_domain_instance(self):
         manifest = apptesting.manifest_data_fixture()
-        self.DBCollectionMock.find_one.return_value = self.set_expected(manifest)
+        self.DBCollectionMock.find_one_ret = self.set_expected(manifest)
         store = self.Adapter(self.DBCollectionMock)
         data = store.fetch("0034-8910-rsp-48-2")
         # XXX: Teste incompleto, pois não testa o retorno de forma precisa
@@ -73,12 +119,13 @@ class StoreTestMixin:
         store.update(data)
         expected = data.manifest
         expected["_id"] = "0034-8910-rsp-48-2"
-        self.DBCollectionMock.replace_one.assert_called_once_with(
-            {"_id": "0034-8910-rsp-48-2"}, self.set_expected(expected)
+        self.assertEqual(
+            self.DBCollectionMock.replace_one_calls,
+            [({"_id": "0034-8910-rsp-48-2"}, self.set_expected(expected))],
         )
 
     def test_update_raises_exception_if_does_not_exist(self):
-        self.DBCollectionMock.replace_one.return_value = Mock(matched_count=0)
+        self.DBCollectionMock.replace_one_ret = SimpleNamespace(matched_count=0)
         store = self.Adapter(self.DBCollectionMock)
         data = self.DomainClass(id="0034-8910-rsp-48-2")
         self.assertRaises(exceptions.DoesNotExist, store.update, data)
@@ -87,8 +134,9 @@ class StoreTestMixin:
         store = self.Adapter(self.DBCollectionMock)
         data = self.DomainClass(manifest={"_id": "1", "id": "0034-8910-rsp-48-2"})
         store.update(data)
-        self.DBCollectionMock.replace_one.assert_called_once_with(
-            {"_id": "1"}, self.set_expected(data.manifest)
+        self.assertEqual(
+            self.DBCollectionMock.replace_one_calls,
+            [({"_id": "1"}, self.set_expected(data.manifest))],
         )
 
 
@@ -126,6 +174,21 @@ class JournalStoreTest(StoreTestMixin, unittest.TestCase):
         return value
 
 
+@contextlib.contextmanager
+def _silenced_logger(name):
+    """Descarta temporariamente os registros emitidos pelo logger `name`, sem
+    afetar a configuração dos demais loggers.
+    """
+    logger = logging.getLogger(name)
+    handlers, propagate = logger.handlers, logger.propagate
+    logger.handlers = [logging.NullHandler()]
+    logger.propagate = False
+    try:
+        yield logger
+    finally:
+        logger.handlers, logger.propagate = handlers, propagate
+
+
 class SessionTestMixin:
     """Testa a interface de `interfaces.Session`. Qualquer classe que implementar
     a interface mencionada deverá acompanhar um conjunto de testes que herdam
@@ -169,65 +232,71 @@ class SessionTestMixin:
         callback.assert_called_once_with("foo", session)
 
     def test_notify_doesnt_propagate_exceptions(self):
-        import logging
-
-        try:
-            # essa manobra de desligar temporariamente o log é para evitar
-            # que a mensagem que será emitida em decorrência da execução de
-            # `notify` suje o relatório de execução dos testes automatizados.
-            # caso essa manobra seja necessária novamente, sugiro transformá-la
-            # num decorator ou context-manager.
-            logging.disable(logging.CRITICAL)
-
+        # o log é silenciado para evitar que a mensagem emitida em decorrência
+        # da execução de `notify` suje o relatório de execução dos testes.
+        with _silenced_logger("documentstore.interfaces"):
             session = self.Session()
             session.observe("test_event", lambda d, s: 1 / 0)
             self.assertIsNone(session.notify("test_event", "foo"))
-        finally:
-            logging.disable(logging.NOTSET)
 
     def test_notify_logs_exceptions(self):
         session = self.Session()
         session.observe("test_event", lambda d, s: 1 / 0)
-        with self.assertLogs("documentstore.interfaces") as log:
+        with self.assertLogs("documentstore.interfaces", level="ERROR") as log:
             session.notify("test_event", "foo")
 
-        has_message = False
-        for log_message in log.output:
-            if (
-                "ERROR:documentstore.interfaces:cannot run callback" in log_message
-                and "Traceback (most recent call last):" in log_message
-                and "ZeroDivisionError: division by zero" in log_message
-            ):
-                has_message = True
-        self.assertTrue(has_message)
+        self.assertTrue(
+            any(
+                record.exc_info
+                and record.exc_info[0] is ZeroDivisionError
+                and record.getMessage().startswith("cannot run callback")
+                for record in log.records
+            )
+        )
 
 
 class AppTestingSessionTests(SessionTestMixin, unittest.TestCase):
     Session = apptesting.Session
 
 
-class MongoClientStub:
-    documents = documents_bundles = journals = changes = None
+_MONGO_CLIENT_STUB = apptesting.MongoClientStub()
 
 
 class SessionTests(SessionTestMixin, unittest.TestCase):
     def Session(self):
-        return adapters.Session(MongoClientStub())
+        return adapters.Session(_MONGO_CLIENT_STUB)
+
+
+_CHANGE_A = MappingProxyType(
+    {
+        "timestamp": "2018-08-05T23:03:44.971230Z",
+        "id": "0034-8910-rsp-48-2-0347",
+        "entity": "document",
+    }
+)
+_CHANGE_B = MappingProxyType(
+    {
+        "timestamp": "2018-08-05T23:03:47.891432Z",
+        "id": "0034-8910-rsp-48-2-0348",
+        "entity": "document",
+    }
+)
+_CHANGE_C = MappingProxyType(
+    {
+        "timestamp": "2018-08-05T23:06:47.621560Z",
+        "id": "0034-8910-rsp-48-2-0348",
+        "entity": "document",
+    }
+)
+# as lojas de mudanças atribuem o `_id` aos registros adicionados, portanto os
+# testes devem adicionar cópias destes registros, obtidas com `dict`.
+_CHANGES = (_CHANGE_A, _CHANGE_B, _CHANGE_C)
 
 
 class ChangesStoreTestMixin:
     def test_add_returns_none(self):
         store = self.Store()
-
-        self.assertIsNone(
-            store.add(
-                {
-                    "timestamp": "2018-08-05T23:03:44.971230Z",
-                    "id": "0034-8910-rsp-48-2-0347",
-                    "entity": "document",
-                }
-            )
-        )
+        self.assertIsNone(store.add(dict(_CHANGE_A)))
 
     def test_add_raises_error_when_timestamp_key_doesnt_exist(self):
         store = self.Store()
@@ -244,109 +313,31 @@ class ChangesStoreTestMixin:
 
     def test_add_raises_error_when_timestamp_already_exists(self):
         store = self.Store()
-
-        store.add(
-            {
-                "timestamp": "2018-08-05T23:03:44.971230Z",
-                "id": "0034-8910-rsp-48-2-0347",
-                "entity": "document",
-            }
-        )
-
-        self.assertRaises(
-            exceptions.AlreadyExists,
-            store.add,
-            {
-                "timestamp": "2018-08-05T23:03:44.971230Z",
-                "id": "0034-8910-rsp-48-2-0347",
-                "entity": "document",
-            },
-        )
+        store.add(dict(_CHANGE_A))
+        self.assertRaises(exceptions.AlreadyExists, store.add, dict(_CHANGE_A))
 
     def test_filter_returns_empty_list(self):
         store = self.Store()
         self.assertEqual(list(store.filter()), [])
 
-    def test_filter_returns_list(self):
-        store = self.Store()
-
-        changes = [
-            {
-                "timestamp": "2018-08-05T23:03:44.971230Z",
-                "id": "0034-8910-rsp-48-2-0347",
-                "entity": "document",
-            },
-            {
-                "timestamp": "2018-08-05T23:03:47.891432Z",
-                "id": "0034-8910-rsp-48-2-0348",
-                "entity": "document",
-            },
-        ]
-
-        for change in changes:
-            store.add(change)
-
-        self.assertEqual(list(store.filter()), changes)
-
-    def test_filter_since(self):
-
+    def test_filter(self):
         store = self.Store()
-
-        changes = [
-            {
-                "timestamp": "2018-08-05T23:03:44.971230Z",
-                "id": "0034-8910-rsp-48-2-0347",
-                "entity": "document",
-            },
-            {
-                "timestamp": "2018-08-05T23:03:47.891432Z",
-                "id": "0034-8910-rsp-48-2-0348",
-                "entity": "document",
-            },
-            {
-                "timestamp": "2018-08-05T23:06:47.621560Z",
-                "id": "0034-8910-rsp-48-2-0348",
-                "entity": "document",
-            },
-        ]
+        changes = [dict(change) for change in _CHANGES]
 
         for change in changes:
             store.add(change)
 
-        self.assertEqual(
-            list(store.filter(since="2018-08-05T23:03:47.891432Z")), changes[2:]
-        )
-
-    def test_filter_limit(self):
-
-        store = self.Store()
-
-        changes = [
-            {
-                "timestamp": "2018-08-05T23:03:44.971230Z",
-                "id": "0034-8910-rsp-48-2-0347",
-                "entity": "document",
-            },
-            {
-                "timestamp": "2018-08-05T23:03:47.891432Z",
-                "id": "0034-8910-rsp-48-2-0348",
-                "entity": "document",
-            },
-            {
-                "timestamp": "2018-08-05T23:06:47.621560Z",
-                "id": "0034-8910-rsp-48-2-0348",
-                "entity": "document",
-            },
+        cases = [
+            ({}, changes),
+            ({"since": "2018-08-05T23:03:47.891432Z"}, changes[2:]),
+            ({"since": "2018-08-05T23:06:47.621560Z"}, []),
+            ({"limit": 2}, changes[:2]),
         ]
-
-        for change in changes:
-            store.add(change)
-
-        self.assertEqual(list(store.filter(limit=2)), changes[:2])
+        for kwargs, expected in cases:
+            with self.subTest(**kwargs):
+                self.assertEqual(list(store.filter(**kwargs)), expected)
 
     def test_fetch_by_id(self):
-        from bson.objectid import ObjectId
-
         store = self.Store()
 
         changes = [
@@ -377,7 +368,13 @@ class ChangesStoreTestMixin:
 
 
 class InMemoryChangesStoreTest(ChangesStoreTestMixin, unittest.TestCase):
-    Store = apptesting.InMemoryChangesDataStore
+    @classmethod
+    def setUpClass(cls):
+        cls._store = apptesting.InMemoryChangesDataStore()
+
+    def Store(self):
+        self._store.reset()
+        return self._store
 
 
 class ChangesStoreTest(ChangesStoreTestMixin, unittest.TestCase):
@@ -405,8 +402,6 @@ class MongoDBTests(unittest.TestCase):
         mock_mongoclient.assert_not_called()
 
     def test_create_indexes_on_changes_timestamp(self):
-        import pymongo
-
         mock_mongodb_collection = Mock()
         mock_mongodb_collection.create_index = Mock()
         with patch(
@@ -1,26 +1,51 @@
-import functools
 import unittest
 
 from documentstore.domain import DocumentManifest
 
 
+FAKE_NOW = "2018-08-05T22:33:49.795151Z"
+
+
 def fake_utcnow():
-    return "2018-08-05T22:33:49.795151Z"
+    return FAKE_NOW
+
+
+def mk_version(data, assets, timestamp=FAKE_NOW):
+    """Produz a versão, sem manifestações, esperada como resultado de
+    `add_version`.
+    """
+    return {"data": data, "assets": assets, "timestamp": timestamp, "renditions": []}
+
+
+def expected_manifest(*versions, **metadata):
+    """Produz o manifesto esperado para o documento usado nos testes, com
+    `versions` na ordem em que foram adicionadas.
+    """
+    return {**metadata, "id": "0034-8910-rsp-48-2-0275", "versions": list(versions)}
 
 
 new = DocumentManifest.new
-add_version = functools.partial(DocumentManifest.add_version, now=fake_utcnow)
-add_asset_version = functools.partial(
-    DocumentManifest.add_asset_version, now=fake_utcnow
-)
-add_rendition_version = functools.partial(
-    DocumentManifest.add_rendition_version, now=fake_utcnow
-)
+
+
+def add_version(manifest, data_uri, assets, renditions=None, *, now=fake_utcnow):
+    return DocumentManifest.add_version(manifest, data_uri, assets, renditions, now=now)
+
+
+def add_asset_version(manifest, asset_id, asset_uri, *, now=fake_utcnow):
+    return DocumentManifest.add_asset_version(manifest, asset_id, asset_uri, now=now)
+
+
+def add_rendition_version(
+    manifest, filename, data_uri, mimetype, lang, size_bytes, *, now=fake_utcnow
+):
+    return DocumentManifest.add_rendition_version(
+        manifest, filename, data_uri, mimetype, lang, size_bytes, now=now
+    )
 
 
 class TestNewManifest(unittest.TestCase):
     def test_minimal_structure(self):
-        expected = {"id": "0034-8910-rsp-48-2-0275", "versions": []}
+        expected = expected_manifest()
         self.assertEqual(new("0034-8910-rsp-48-2-0275"), expected)
 
     def test_ids_are_converted_to_str(self):
@@ -31,17 +56,12 @@ class TestNewManifest(unittest.TestCase):
 class TestAddVersion(unittest.TestCase):
     def test_first_version(self):
         doc = {"id": "0034-8910-rsp-48-2-0275", "versions": []}
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-                    "assets": {"0034-8910-rsp-48-2-0275-gf01.gif": []},
-                    "timestamp": fake_utcnow(),
-                    "renditions": [],
-                }
-            ],
-        }
+        expected = expected_manifest(
+            mk_version(
+                "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+                {"0034-8910-rsp-48-2-0275-gf01.gif": []},
+            ),
+        )
 
         self.assertEqual(
             add_version(
@@ -65,17 +85,12 @@ class TestAddVersion(unittest.TestCase):
 
     def test_add_version_with_assets_mapping(self):
         doc = {"id": "0034-8910-rsp-48-2-0275", "versions": []}
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-                    "assets": {"0034-8910-rsp-48-2-0275-gf01.gif": []},
-                    "timestamp": fake_utcnow(),
-                    "renditions": [],
-                }
-            ],
-        }
+        expected = expected_manifest(
+            mk_version(
+                "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+                {"0034-8910-rsp-48-2-0275-gf01.gif": []},
+            ),
+        )
 
         self.assertEqual(
             add_version(
@@ -88,19 +103,16 @@ class TestAddVersion(unittest.TestCase):
 
     def test_add_version_with_assets_mapping_nonempty(self):
         doc = {"id": "0034-8910-rsp-48-2-0275", "versions": []}
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-                    "assets": {
-                        "0034-8910-rsp-48-2-0275-gf01.gif": [
-                            "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif"
-                        ]
-                    },
-                }
-            ],
-        }
+        expected = expected_manifest(
+            {
+                "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+                "assets": {
+                    "0034-8910-rsp-48-2-0275-gf01.gif": [
+                        "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif"
+                    ]
+                },
+            },
+        )
 
         self.assertEqual(
             add_version(
@@ -130,26 +142,23 @@ class TestAddVersion(unittest.TestCase):
                 }
             ],
         }
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-                    "assets": {
-                        "0034-8910-rsp-48-2-0275-gf01.gif": [
-                            (
-                                "2018-08-05 21:15:07.795137",
-                                "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif",
-                            ),
-                            (
-                                fake_utcnow(),
-                                "/rawfiles/7a664999a8fb3/0034-8910-rsp-48-2-0275-gf01.gif",
-                            ),
-                        ]
-                    },
-                }
-            ],
-        }
+        expected = expected_manifest(
+            {
+                "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+                "assets": {
+                    "0034-8910-rsp-48-2-0275-gf01.gif": [
+                        (
+                            "2018-08-05 21:15:07.795137",
+                            "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif",
+                        ),
+                        (
+                            FAKE_NOW,
+                            "/rawfiles/7a664999a8fb3/0034-8910-rsp-48-2-0275-gf01.gif",
+                        ),
+                    ]
+                },
+            },
+        )
 
         self.assertEqual(
             add_asset_version(
@@ -171,23 +180,20 @@ class TestAddVersion(unittest.TestCase):
                 }
             ],
         }
-        expected = {
-            "_revision": "a1eda318424",
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-                    "assets": {
-                        "0034-8910-rsp-48-2-0275-gf01.gif": [
-                            (
-                                fake_utcnow(),
-                                "/rawfiles/7a664999a8fb3/0034-8910-rsp-48-2-0275-gf01.gif",
-                            )
-                        ]
-                    },
-                }
-            ],
-        }
+        expected = expected_manifest(
+            {
+                "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+                "assets": {
+                    "0034-8910-rsp-48-2-0275-gf01.gif": [
+                        (
+                            FAKE_NOW,
+                            "/rawfiles/7a664999a8fb3/0034-8910-rsp-48-2-0275-gf01.gif",
+                        )
+                    ]
+                },
+            },
+            _revision="a1eda318424",
+        )
 
         self.assertEqual(
             add_asset_version(
@@ -239,27 +245,24 @@ class TestAddVersion(unittest.TestCase):
 class AddRenditionVersionTests(unittest.TestCase):
     def test_first_version(self):
         doc = {"id": "0034-8910-rsp-48-2-0275", "versions": [{"renditions": []}]}
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "renditions": [
-                        {
-                            "filename": "0034-8910-rsp-48-2-0275.pdf",
-                            "data": [
-                                {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",
-                                    "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
-                                    "size_bytes": 243000,
-                                }
-                            ],
-                            "mimetype": "application/pdf",
-                            "lang": "pt-br",
-                        }
-                    ]
-                }
-            ],
-        }
+        expected = expected_manifest(
+            {
+                "renditions": [
+                    {
+                        "filename": "0034-8910-rsp-48-2-0275.pdf",
+                        "data": [
+                            {
+                                "timestamp": FAKE_NOW,
+                                "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
+                                "size_bytes": 243000,
+                            }
+                        ],
+                        "mimetype": "application/pdf",
+                        "lang": "pt-br",
+                    }
+                ]
+            },
+        )
 
         self.assertEqual(
             add_rendition_version(
@@ -283,7 +286,7 @@ class AddRenditionVersionTests(unittest.TestCase):
                             "filename": "0034-8910-rsp-48-2-0275.pdf",
                             "data": [
                                 {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",
+                                    "timestamp": FAKE_NOW,
                                     "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
                                     "size_bytes": 243000,
                                 }
@@ -295,32 +298,29 @@ class AddRenditionVersionTests(unittest.TestCase):
                 }
             ],
         }
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "renditions": [
-                        {
-                            "filename": "0034-8910-rsp-48-2-0275.pdf",
-                            "data": [
-                                {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",
-                                    "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
-                                    "size_bytes": 243000,
-                                },
-                                {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",  # vai repetir nos testes
-                                    "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275-v2.pdf",
-                                    "size_bytes": 223461,
-                                },
-                            ],
-                            "mimetype": "application/pdf",
-                            "lang": "pt-br",
-                        }
-                    ]
-                }
-            ],
-        }
+        expected = expected_manifest(
+            {
+                "renditions": [
+                    {
+                        "filename": "0034-8910-rsp-48-2-0275.pdf",
+                        "data": [
+                            {
+                                "timestamp": FAKE_NOW,
+                                "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
+                                "size_bytes": 243000,
+                            },
+                            {
+                                "timestamp": FAKE_NOW,  # vai repetir nos testes
+                                "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275-v2.pdf",
+                                "size_bytes": 223461,
+                            },
+                        ],
+                        "mimetype": "application/pdf",
+                        "lang": "pt-br",
+                    }
+                ]
+            },
+        )
 
         self.assertEqual(
             add_rendition_version(
@@ -344,7 +344,7 @@ class AddRenditionVersionTests(unittest.TestCase):
                             "filename": "0034-8910-rsp-48-2-0275.pdf",
                             "data": [
                                 {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",
+                                    "timestamp": FAKE_NOW,
                                     "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
                                     "size_bytes": 243000,
                                 }
@@ -356,39 +356,36 @@ class AddRenditionVersionTests(unittest.TestCase):
                 }
             ],
         }
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "renditions": [
-                        {
-                            "filename": "0034-8910-rsp-48-2-0275.pdf",
-                            "data": [
-                                {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",
-                                    "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
-                                    "size_bytes": 243000,
-                                }
-                            ],
-                            "mimetype": "application/pdf",
-                            "lang": "pt-br",
-                        },
-                        {
-                            "filename": "0034-8910-rsp-48-2-0275.pdf",
-                            "data": [
-                                {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",  # vai repetir nos testes
-                                    "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275-v2.pdf",
-                                    "size_bytes": 223461,
-                                }
-                            ],
-                            "mimetype": "application/pdf",
-                            "lang": "pt",
-                        },
-                    ]
-                }
-            ],
-        }
+        expected = expected_manifest(
+            {
+                "renditions": [
+                    {
+                        "filename": "0034-8910-rsp-48-2-0275.pdf",
+                        "data": [
+                            {
+                                "timestamp": FAKE_NOW,
+                                "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
+                                "size_bytes": 243000,
+                            }
+                        ],
+                        "mimetype": "application/pdf",
+                        "lang": "pt-br",
+                    },
+                    {
+                        "filename": "0034-8910-rsp-48-2-0275.pdf",
+                        "data": [
+                            {
+                                "timestamp": FAKE_NOW,  # vai repetir nos testes
+                                "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275-v2.pdf",
+                                "size_bytes": 223461,
+                            }
+                        ],
+                        "mimetype": "application/pdf",
+                        "lang": "pt",
+                    },
+                ]
+            },
+        )
 
         self.assertEqual(
             add_rendition_version(
@@ -412,7 +409,7 @@ class AddRenditionVersionTests(unittest.TestCase):
                             "filename": "0034-8910-rsp-48-2-0275.pdf",
                             "data": [
                                 {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",
+                                    "timestamp": FAKE_NOW,
                                     "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
                                     "size_bytes": 243000,
                                 }
@@ -424,39 +421,36 @@ class AddRenditionVersionTests(unittest.TestCase):
                 }
             ],
         }
-        expected = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [
-                {
-                    "renditions": [
-                        {
-                            "filename": "0034-8910-rsp-48-2-0275.pdf",
-                            "data": [
-                                {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",
-                                    "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
-                                    "size_bytes": 243000,
-                                }
-                            ],
-                            "mimetype": "application/pdf",
-                            "lang": "pt-br",
-                        },
-                        {
-                            "filename": "0034-8910-rsp-48-2-0275.pdf",
-                            "data": [
-                                {
-                                    "timestamp": "2018-08-05T22:33:49.795151Z",  # vai repetir nos testes
-                                    "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275-v2.pdf",
-                                    "size_bytes": 223461,
-                                }
-                            ],
-                            "mimetype": "application/octet-stream",
-                            "lang": "pt-br",
-                        },
-                    ]
-                }
-            ],
-        }
+        expected = expected_manifest(
+            {
+                "renditions": [
+                    {
+                        "filename": "0034-8910-rsp-48-2-0275.pdf",
+                        "data": [
+                            {
+                                "timestamp": FAKE_NOW,
+                                "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.pdf",
+                                "size_bytes": 243000,
+                            }
+                        ],
+                        "mimetype": "application/pdf",
+                        "lang": "pt-br",
+                    },
+                    {
+                        "filename": "0034-8910-rsp-48-2-0275.pdf",
+                        "data": [
+                            {
+                                "timestamp": FAKE_NOW,  # vai repetir nos testes
+                                "url": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275-v2.pdf",
+                                "size_bytes": 223461,
+                            }
+                        ],
+                        "mimetype": "application/octet-stream",
+                        "lang": "pt-br",
+                    },
+                ]
+            },
+        )
 
         self.assertEqual(
             add_rendition_version(
@@ -1,25 +1,31 @@
 import unittest
 from unittest import mock
-import functools
-from copy import deepcopy
 import datetime
 
 from documentstore import domain, exceptions
 
+# literais recorrentes nos manifestos de exemplo e nos resultados esperados.
+DOC_ID = "0034-8910-rsp-48-2-0275"
+GF01 = "0034-8910-rsp-48-2-0275-gf01.gif"
+GF01_V1_URL = "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif"
+GF01_V2_URL = "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif"
+XML_V1_URL = "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml"
+XML_V2_URL = "/rawfiles/2d3ad9c6bc656/0034-8910-rsp-48-2-0275.xml"
+
 SAMPLE_MANIFEST = {
-    "id": "0034-8910-rsp-48-2-0275",
+    "id": DOC_ID,
     "versions": [
         {
-            "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+            "data": XML_V1_URL,
             "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": [
+                GF01: [
                     (
                         "2018-08-05T23:03:44.971230Z",
-                        "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V1_URL,
                     ),
                     (
                         "2018-08-05T23:08:41.590174Z",
-                        "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V2_URL,
                     ),
                 ]
             },
@@ -27,12 +33,12 @@ SAMPLE_MANIFEST = {
             "renditions": [],
         },
         {
-            "data": "/rawfiles/2d3ad9c6bc656/0034-8910-rsp-48-2-0275.xml",
+            "data": XML_V2_URL,
             "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": [
+                GF01: [
                     (
                         "2018-08-05T23:30:29.392995Z",
-                        "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V2_URL,
                     )
                 ]
             },
@@ -42,19 +48,19 @@ SAMPLE_MANIFEST = {
     ],
 }
 SAMPLE_MANIFEST_WITH_RENDITIONS = {
-    "id": "0034-8910-rsp-48-2-0275",
+    "id": DOC_ID,
     "versions": [
         {
-            "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+            "data": XML_V1_URL,
             "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": [
+                GF01: [
                     (
                         "2018-08-05T23:03:44.971230Z",
-                        "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V1_URL,
                     ),
                     (
                         "2018-08-05T23:08:41.590174Z",
-                        "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V2_URL,
                     ),
                 ]
             },
@@ -74,12 +80,12 @@ SAMPLE_MANIFEST_WITH_RENDITIONS = {
             ],
         },
         {
-            "data": "/rawfiles/2d3ad9c6bc656/0034-8910-rsp-48-2-0275.xml",
+            "data": XML_V2_URL,
             "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": [
+                GF01: [
                     (
                         "2018-08-05T23:30:29.392995Z",
-                        "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V2_URL,
                     )
                 ]
             },
@@ -119,19 +125,19 @@ SAMPLE_MANIFEST_WITH_RENDITIONS = {
     ],
 }
 SAMPLE_MANIFEST_WITH_DELETIONS = {
-    "id": "0034-8910-rsp-48-2-0275",
+    "id": DOC_ID,
     "versions": [
         {
-            "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+            "data": XML_V1_URL,
             "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": [
+                GF01: [
                     (
                         "2018-08-05T23:03:44.971230Z",
-                        "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V1_URL,
                     ),
                     (
                         "2018-08-05T23:08:41.590174Z",
-                        "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+                        GF01_V2_URL,
                     ),
                 ]
             },
@@ -141,36 +147,195 @@ SAMPLE_MANIFEST_WITH_DELETIONS = {
         {"deleted": True, "timestamp": "2018-08-05T23:30:29.392990Z"},
     ],
 }
+SAMPLE_MANIFEST_WITH_DELETIONS_ONLY = {
+    "id": DOC_ID,
+    "versions": [{"deleted": True, "timestamp": "2018-08-05T23:30:29.392990Z"}],
+}
+
+
+# visões esperadas de `Document.version` e `Document.version_at`. São apenas
+# comparadas, nunca alteradas, e por isso podem ser compartilhadas pelos testes.
+OLDEST_VERSION = {
+    "data": XML_V1_URL,
+    "assets": {GF01: GF01_V2_URL},
+    "timestamp": "2018-08-05T23:02:29.392990Z",
+    "renditions": [],
+}
+LATEST_VERSION = {
+    "data": XML_V2_URL,
+    "assets": {GF01: GF01_V2_URL},
+    "timestamp": "2018-08-05T23:30:29.392990Z",
+    "renditions": [],
+}
+DELETED_VERSION = {"deleted": True, "timestamp": "2018-08-05T23:30:29.392990Z"}
+LATEST_RENDITIONS = [
+    {
+        "filename": "0034-8910-rsp-48-2-0275-v2-pt.pdf",
+        "mimetype": "application/pdf",
+        "lang": "pt",
+        "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-pt.pdf",
+        "size_bytes": 123456,
+    },
+    {
+        "filename": "0034-8910-rsp-48-2-0275-v2-en.pdf",
+        "mimetype": "application/pdf",
+        "lang": "en",
+        "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-2-en.pdf",
+        "size_bytes": 123456,
+    },
+]
+OLDEST_RENDITIONS = [
+    {
+        "filename": "0034-8910-rsp-48-2-0275-pt.pdf",
+        "mimetype": "application/pdf",
+        "lang": "pt",
+        "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-pt.pdf",
+        "size_bytes": 123456,
+    }
+]
+RENDITIONS_AT_GIVEN_TIME = [
+    {
+        "filename": "0034-8910-rsp-48-2-0275-v2-pt.pdf",
+        "mimetype": "application/pdf",
+        "lang": "pt",
+        "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-pt.pdf",
+        "size_bytes": 123456,
+    },
+    {
+        "filename": "0034-8910-rsp-48-2-0275-v2-en.pdf",
+        "mimetype": "application/pdf",
+        "lang": "en",
+        "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-en.pdf",
+        "size_bytes": 123456,
+    },
+]
+
+
+def _shallow_manifest(manifest):
+    """Cópia de `manifest` em que apenas a lista de versões é nova. Basta aos
+    testes que acrescentam versões ou manifestações por meio de `Document`,
+    já que as funções de `DocumentManifest` nunca alteram o manifesto
+    recebido.
+    """
+    return {**manifest, "versions": list(manifest["versions"])}
+
+
+FAKE_NOW = "2018-08-05T22:33:49.795151Z"
+FAKE_LATER = "2018-08-05T22:34:07.795151Z"
 
 
 def fake_utcnow():
-    return "2018-08-05T22:33:49.795151Z"
+    return FAKE_NOW
+
+
+def fake_later_utcnow():
+    return FAKE_LATER
+
+
+def empty_assets_getter(data_url, timeout):
+    return (None, [])
+
+
+def gf01_assets_getter(data_url, timeout):
+    return (None, [(GF01, None)])
+
+
+def fibonacci(maximo):
+    """Gera a sequência de Fibonacci, em strings, até `maximo`. Serve como
+    objeto semelhante a uma lista que não é `list`, `tuple` nem `str`.
+    """
+    current, following = 0, 1
+    while current <= maximo:
+        yield str(current)
+        current, following = following, current + following
+
+
+class FakeDatetimeMixin:
+    """Fixa `domain.datetime.utcnow` em 2018-08-05T22:33:49.795151 durante
+    toda a execução da classe de testes. Testes que precisem de outro instante
+    podem aplicar seu próprio *patch* sobre este.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._datetime_patcher = mock.patch.object(
+            domain, "datetime", mock.Mock(wraps=datetime.datetime)
+        )
+        mocked_datetime = cls._datetime_patcher.start()
+        mocked_datetime.utcnow.return_value = datetime.datetime(
+            2018, 8, 5, 22, 33, 49, 795151
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._datetime_patcher.stop()
+        super().tearDownClass()
+
+
+class SharedInstanceMixin:
+    """Cria uma única instância, por meio de `make_shared_instance`, para os
+    testes da classe que apenas a consultam. Ao final de cada teste verifica
+    que o seu manifesto não foi alterado.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.shared_instance = cls.make_shared_instance()
+        cls._shared_manifest = cls.shared_instance.manifest
+
+    def tearDown(self):
+        self.assertEqual(
+            self.shared_instance.manifest,
+            self._shared_manifest,
+            "a instância compartilhada foi alterada pelo teste",
+        )
+        super().tearDown()
 
 
 class UnittestMixin:
     def _assert_raises_with_message(self, type, message, func, *args):
-        try:
+        with self.assertRaises(type) as cm:
             func(*args)
-        except type as exc:
-            self.assertEqual(str(exc), message)
-        else:
-            self.assertTrue(False)
+        self.assertEqual(str(cm.exception), message)
+
+    def _assert_metadata_roundtrip(self, obj, attr, expected):
+        """Verifica, numa só comparação, o valor de `attr` obtido pelo getter e
+        o gravado em `manifest["metadata"]`.
+        """
+        self.assertEqual(
+            (getattr(obj, attr), obj.manifest["metadata"][attr]), (expected, expected)
+        )
+
 
+def new_bundle(bundle_id):
+    return domain.BundleManifest.new(bundle_id, now=fake_utcnow)
 
-new_bundle = functools.partial(domain.BundleManifest.new, now=fake_utcnow)
 
+class DocumentTests(SharedInstanceMixin, unittest.TestCase):
+    @classmethod
+    def make_shared_instance(cls):
+        # a instância não copia `SAMPLE_MANIFEST`, então a verificação feita
+        # em `tearDown` também denuncia alterações no próprio manifesto.
+        return domain.Document(manifest=SAMPLE_MANIFEST)
 
-class DocumentTests(unittest.TestCase):
     def make_one(self):
-        _manifest = deepcopy(SAMPLE_MANIFEST)
+        _manifest = _shallow_manifest(SAMPLE_MANIFEST)
         return domain.Document(manifest=_manifest)
 
+    def make_one_readonly(self):
+        """Instância para os testes que apenas consultam o documento. Os que
+        o modificam devem usar `make_one`.
+        """
+        return self.shared_instance
+
     def test_manifest_is_generated_on_init(self):
-        document = domain.Document(id="0034-8910-rsp-48-2-0275")
+        document = domain.Document(id=DOC_ID)
         self.assertTrue(isinstance(document.manifest, dict))
 
     def test_manifest_as_arg_on_init(self):
-        existing_manifest = {"id": "0034-8910-rsp-48-2-0275", "versions": []}
+        existing_manifest = {"id": DOC_ID, "versions": []}
         document = domain.Document(manifest=existing_manifest)
         self.assertEqual(existing_manifest, document.manifest)
 
@@ -185,8 +350,12 @@ class DocumentTests(unittest.TestCase):
         self.assertEqual(document.id(), "")
 
     def test_id(self):
-        document = domain.Document(id="0034-8910-rsp-48-2-0275")
-        self.assertEqual(document.id(), "0034-8910-rsp-48-2-0275")
+        document = domain.Document(id=DOC_ID)
+        self.assertEqual(document.id(), DOC_ID)
+
+    def test_instances_have_no_attributes_dict(self):
+        document = domain.Document(id=DOC_ID)
+        self.assertFalse(hasattr(document, "__dict__"))
 
     def test_new_version_of_data(self):
         document = self.make_one()
@@ -194,62 +363,48 @@ class DocumentTests(unittest.TestCase):
 
         document.new_version(
             "/rawfiles/5e3ad9c6cd6b8/0034-8910-rsp-48-2-0275.xml",
-            assets_getter=lambda data_url, timeout: (None, []),
+            assets_getter=empty_assets_getter,
         )
         self.assertEqual(len(document.manifest["versions"]), 3)
 
     def test_get_latest_version(self):
-        document = self.make_one()
+        document = self.make_one_readonly()
         latest = document.version()
-        self.assertEqual(
-            latest["data"], "/rawfiles/2d3ad9c6bc656/0034-8910-rsp-48-2-0275.xml"
-        )
+        self.assertEqual(latest["data"], XML_V2_URL)
 
     def test_get_latest_version_when_there_isnt_any(self):
-        document = domain.Document(id="0034-8910-rsp-48-2-0275")
+        document = domain.Document(id=DOC_ID)
         self.assertRaises(ValueError, lambda: document.version())
 
     def test_get_oldest_version(self):
-        document = self.make_one()
+        document = self.make_one_readonly()
         oldest = document.version(0)
-        self.assertEqual(
-            oldest["data"], "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml"
-        )
+        self.assertEqual(oldest["data"], XML_V1_URL)
 
     def test_version_only_shows_newest_assets(self):
-        document = self.make_one()
+        document = self.make_one_readonly()
         oldest = document.version(0)
-        expected = {
-            "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-            "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif"
-            },
-            "timestamp": "2018-08-05T23:02:29.392990Z",
-            "renditions": [],
-        }
-        self.assertEqual(oldest, expected)
+        self.assertEqual(oldest, OLDEST_VERSION)
 
     def test_version_of_deleted_document(self):
         document = domain.Document(manifest=SAMPLE_MANIFEST_WITH_DELETIONS)
-        expected = {"deleted": True,
-                    "timestamp": "2018-08-05T23:30:29.392990Z"}
-        self.assertEqual(document.version(), expected)
+        self.assertEqual(document.version(), DELETED_VERSION)
 
     def test_new_version_automaticaly_references_latest_known_assets(self):
         manifest = {
-            "id": "0034-8910-rsp-48-2-0275",
+            "id": DOC_ID,
             "versions": [
                 {
-                    "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+                    "data": XML_V1_URL,
                     "assets": {
-                        "0034-8910-rsp-48-2-0275-gf01.gif": [
+                        GF01: [
                             (
                                 "2018-08-05T23:03:44.971230Z",
-                                "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif",
+                                GF01_V1_URL,
                             ),
                             (
                                 "2018-08-05T23:03:49.971250Z",
-                                "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+                                GF01_V2_URL,
                             ),
                         ]
                     },
@@ -260,16 +415,13 @@ class DocumentTests(unittest.TestCase):
 
         document = domain.Document(manifest=manifest)
         document.new_version(
-            "/rawfiles/2d3ad9c6bc656/0034-8910-rsp-48-2-0275.xml",
-            assets_getter=lambda data_url, timeout: (
-                None,
-                [("0034-8910-rsp-48-2-0275-gf01.gif", None)],
-            ),
+            XML_V2_URL,
+            assets_getter=gf01_assets_getter,
         )
         latest = document.version()
         self.assertEqual(
-            latest["assets"]["0034-8910-rsp-48-2-0275-gf01.gif"],
-            "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+            latest["assets"][GF01],
+            GF01_V2_URL,
         )
 
     def test_version_at_later_time(self):
@@ -278,58 +430,172 @@ class DocumentTests(unittest.TestCase):
         produzida nos seguintes instantes: a) dados em 2018-08-05 23:30:29.392990
         e b) ativo digital em 2018-08-05 23:30:29.392995.
         """
-        document = self.make_one()
+        document = self.make_one_readonly()
         target = document.version_at("2018-12-31")
-        expected = {
-            "data": "/rawfiles/2d3ad9c6bc656/0034-8910-rsp-48-2-0275.xml",
-            "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif"
-            },
-            "timestamp": "2018-08-05T23:30:29.392990Z",
-            "renditions": [],
-        }
-        self.assertEqual(target, expected)
+        self.assertEqual(target, LATEST_VERSION)
 
     def test_version_at_given_time(self):
-        document = self.make_one()
+        document = self.make_one_readonly()
         target = document.version_at("2018-08-05T23:04:00Z")
         expected = {
-            "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-            "assets": {
-                "0034-8910-rsp-48-2-0275-gf01.gif": "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif"
-            },
+            "data": XML_V1_URL,
+            "assets": {GF01: GF01_V1_URL},
             "timestamp": "2018-08-05T23:02:29.392990Z",
             "renditions": [],
         }
         self.assertEqual(target, expected)
 
     def test_version_at_time_between_data_and_asset_registration(self):
-        document = self.make_one()
+        document = self.make_one_readonly()
         target = document.version_at("2018-08-05T23:03:43Z")
         expected = {
-            "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
-            "assets": {"0034-8910-rsp-48-2-0275-gf01.gif": ""},
+            "data": XML_V1_URL,
+            "assets": {GF01: ""},
             "timestamp": "2018-08-05T23:02:29.392990Z",
             "renditions": [],
         }
         self.assertEqual(target, expected)
 
     def test_version_at_time_prior_to_data_registration(self):
-        document = self.make_one()
+        document = self.make_one_readonly()
         self.assertRaises(
             ValueError, lambda: document.version_at("2018-07-01"))
 
     def test_version_at_non_UCT_time_raises_exception(self):
-        document = self.make_one()
+        document = self.make_one_readonly()
         self.assertRaises(
             ValueError, lambda: document.version_at("2018-08-05 23:03:44")
         )
 
     def test_version_at_of_deleted_document(self):
         document = domain.Document(manifest=SAMPLE_MANIFEST_WITH_DELETIONS)
-        expected = {"deleted": True,
-                    "timestamp": "2018-08-05T23:30:29.392990Z"}
-        self.assertEqual(document.version_at("2018-08-05T23:30:29Z"), expected)
+        self.assertEqual(
+            document.version_at("2018-08-05T23:30:29Z"), DELETED_VERSION
+        )
+
+    def test_version_at_among_many_asset_versions(self):
+        manifest = {
+            "id": DOC_ID,
+            "versions": [
+                {
+                    "data": XML_V1_URL,
+                    "assets": {
+                        GF01: [
+                            (f"2018-08-06T{h:02d}:{m:02d}:00.000000Z", f"/{h}/{m}.gif")
+                            for h in range(24)
+                            for m in range(60)
+                        ]
+                    },
+                    "timestamp": "2018-08-05T23:02:29.392990Z",
+                    "renditions": [],
+                }
+            ],
+        }
+        document = domain.Document(manifest=manifest)
+        for timestamp, expected in [
+            ("2018-08-05T23:59Z", ""),
+            ("2018-08-06T00:00Z", "/0/0.gif"),
+            ("2018-08-06T12:34:59Z", "/12/34.gif"),
+            ("2018-08-06T23:59:00Z", "/23/59.gif"),
+            ("2018-08-07", "/23/59.gif"),
+        ]:
+            with self.subTest(timestamp=timestamp):
+                self.assertEqual(
+                    document.version_at(timestamp)["assets"][GF01], expected
+                )
+
+    def test_version_at_picks_the_last_of_entries_with_equal_timestamps(self):
+        """Entre versões, ativos ou manifestações registrados no mesmo instante,
+        prevalece o último, assim como em `version()`.
+        """
+        timestamp = "2018-08-05T23:02:29.392990Z"
+        manifest = {
+            "id": DOC_ID,
+            "versions": [
+                {
+                    "data": XML_V1_URL,
+                    "assets": {},
+                    "timestamp": timestamp,
+                    "renditions": [],
+                },
+                {
+                    "data": XML_V2_URL,
+                    "assets": {
+                        GF01: [(timestamp, GF01_V1_URL), (timestamp, GF01_V2_URL)]
+                    },
+                    "timestamp": timestamp,
+                    "renditions": [
+                        {
+                            "filename": "0034-8910-rsp-48-2-0275-en.pdf",
+                            "mimetype": "application/pdf",
+                            "lang": "en",
+                            "data": [
+                                {
+                                    "timestamp": timestamp,
+                                    "url": "/v1.pdf",
+                                    "size_bytes": 1,
+                                },
+                                {
+                                    "timestamp": timestamp,
+                                    "url": "/v2.pdf",
+                                    "size_bytes": 2,
+                                },
+                            ],
+                        }
+                    ],
+                },
+            ],
+        }
+        document = domain.Document(manifest=manifest)
+        target = document.version_at("2018-08-05T23:03Z")
+        self.assertEqual(
+            target,
+            {
+                "data": XML_V2_URL,
+                "assets": {GF01: GF01_V2_URL},
+                "timestamp": timestamp,
+                "renditions": [
+                    {
+                        "filename": "0034-8910-rsp-48-2-0275-en.pdf",
+                        "mimetype": "application/pdf",
+                        "lang": "en",
+                        "url": "/v2.pdf",
+                        "size_bytes": 2,
+                    }
+                ],
+            },
+        )
+        self.assertEqual(target, document.version())
+
+    def test_version_at_visits_a_logarithmic_number_of_versions(self):
+        class CountingList(list):
+            accesses = 0
+
+            def __getitem__(self, index):
+                CountingList.accesses += 1
+                return super().__getitem__(index)
+
+            def __iter__(self):
+                CountingList.accesses += len(self)
+                return super().__iter__()
+
+        versions = CountingList(
+            {
+                "data": f"/rawfiles/{i}/0034-8910-rsp-48-2-0275.xml",
+                "assets": {},
+                "timestamp": f"2018-08-{5 + i // 86400:02d}T"
+                f"{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000000Z",
+                "renditions": [],
+            }
+            for i in range(4096)
+        )
+        document = domain.Document(manifest={"id": DOC_ID, "versions": versions})
+
+        target = document.version_at("2018-08-05T00:50:00Z")
+
+        self.assertEqual(target["data"], "/rawfiles/3000/0034-8910-rsp-48-2-0275.xml")
+        # log2(4096) = 12; uma busca linear visitaria milhares de versões.
+        self.assertLess(CountingList.accesses, 20)
 
     def test_add_new_rendition(self):
         document = self.make_one()
@@ -342,11 +608,9 @@ class DocumentTests(unittest.TestCase):
             "en",
             798765,
         )
-        self.assertEqual(len(document.version()["renditions"]), 1)
-        self.assertEqual(
-            document.version()["renditions"][0]["filename"],
-            "0034-8910-rsp-48-2-0275-en.pdf",
-        )
+        renditions = document.version()["renditions"]
+        self.assertEqual(len(renditions), 1)
+        self.assertEqual(renditions[0]["filename"], "0034-8910-rsp-48-2-0275-en.pdf")
 
     def test_add_second_rendition_version(self):
         document = self.make_one()
@@ -366,15 +630,12 @@ class DocumentTests(unittest.TestCase):
             "en",
             788523,
         )
-        self.assertEqual(len(document.version()["renditions"]), 1)
-        self.assertEqual(
-            document.version()["renditions"][0]["filename"],
-            "0034-8910-rsp-48-2-0275-en.pdf",
-        )
-        self.assertEqual(document.version()[
-                         "renditions"][0]["size_bytes"], 788523)
+        renditions = document.version()["renditions"]
+        self.assertEqual(len(renditions), 1)
+        self.assertEqual(renditions[0]["filename"], "0034-8910-rsp-48-2-0275-en.pdf")
+        self.assertEqual(renditions[0]["size_bytes"], 788523)
         self.assertEqual(
-            document.version()["renditions"][0]["url"],
+            renditions[0]["url"],
             "/rawfiles/5cb5f9b2691cd/0034-8910-rsp-48-2-0275-en.pdf",
         )
 
@@ -401,11 +662,7 @@ class DocumentTests(unittest.TestCase):
         )
 
     def test_add_new_rendition_raises_if_version_is_deleted(self):
-        sample_manifest = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [{"deleted": True, "timestamp": "2018-08-05T23:30:29.392990Z"}],
-        }
-        document = domain.Document(manifest=sample_manifest)
+        document = domain.Document(manifest=SAMPLE_MANIFEST_WITH_DELETIONS_ONLY)
         self.assertRaises(
             exceptions.DeletedVersion,
             document.new_rendition_version,
@@ -417,89 +674,42 @@ class DocumentTests(unittest.TestCase):
         )
 
     def test_get_latest_renditions_of_latest_version(self):
-        expected = [
-            {
-                "filename": "0034-8910-rsp-48-2-0275-v2-pt.pdf",
-                "mimetype": "application/pdf",
-                "lang": "pt",
-                "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-pt.pdf",
-                "size_bytes": 123456,
-            },
-            {
-                "filename": "0034-8910-rsp-48-2-0275-v2-en.pdf",
-                "mimetype": "application/pdf",
-                "lang": "en",
-                "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-2-en.pdf",
-                "size_bytes": 123456,
-            },
-        ]
         document = domain.Document(manifest=SAMPLE_MANIFEST_WITH_RENDITIONS)
-        self.assertEqual(document.version()["renditions"], expected)
+        self.assertEqual(document.version()["renditions"], LATEST_RENDITIONS)
 
     def test_get_renditions_of_a_given_version(self):
-        expected = [
-            {
-                "filename": "0034-8910-rsp-48-2-0275-pt.pdf",
-                "mimetype": "application/pdf",
-                "lang": "pt",
-                "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-pt.pdf",
-                "size_bytes": 123456,
-            }
-        ]
         document = domain.Document(manifest=SAMPLE_MANIFEST_WITH_RENDITIONS)
-        self.assertEqual(document.version(index=0)["renditions"], expected)
+        self.assertEqual(document.version(index=0)["renditions"], OLDEST_RENDITIONS)
 
     def test_get_renditions_of_a_given_version_by_timestamp(self):
-        expected = [
-            {
-                "filename": "0034-8910-rsp-48-2-0275-v2-pt.pdf",
-                "mimetype": "application/pdf",
-                "lang": "pt",
-                "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-pt.pdf",
-                "size_bytes": 123456,
-            },
-            {
-                "filename": "0034-8910-rsp-48-2-0275-v2-en.pdf",
-                "mimetype": "application/pdf",
-                "lang": "en",
-                "url": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2-en.pdf",
-                "size_bytes": 123456,
-            },
-        ]
         document = domain.Document(manifest=SAMPLE_MANIFEST_WITH_RENDITIONS)
         self.assertEqual(
-            document.version_at("2018-08-05T23:40:00Z")["renditions"], expected
-        )
-
-    def test_raises_when_try_to_get_data_from_deleted_document(self):
-        sample_manifest = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [{"deleted": True, "timestamp": "2018-08-05T23:30:29.392990Z"}],
-        }
-        document = domain.Document(manifest=sample_manifest)
-        self.assertRaises(exceptions.DeletedVersion, document.data)
-
-    def test_raises_when_try_to_add_asset_version_to_deleted_document(self):
-        sample_manifest = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [{"deleted": True, "timestamp": "2018-08-05T23:30:29.392990Z"}],
-        }
-        document = domain.Document(manifest=sample_manifest)
-        self.assertRaises(
-            exceptions.DeletedVersion,
-            document.new_asset_version,
-            "0034-8910-rsp-48-2-0275-v2.gif",
-            "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2.gif",
+            document.version_at("2018-08-05T23:40:00Z")["renditions"],
+            RENDITIONS_AT_GIVEN_TIME,
         )
 
-    def test_raises_when_try_to_delete_a_deleted_document(self):
-        sample_manifest = {
-            "id": "0034-8910-rsp-48-2-0275",
-            "versions": [{"deleted": True, "timestamp": "2018-08-05T23:30:29.392990Z"}],
-        }
-        document = domain.Document(manifest=sample_manifest)
-        self.assertRaises(exceptions.VersionAlreadySet,
-                          document.new_deleted_version)
+    def test_operations_on_deleted_document_raise(self):
+        document = domain.Document(manifest=SAMPLE_MANIFEST_WITH_DELETIONS_ONLY)
+        for name, exc, func, args in [
+            ("data", exceptions.DeletedVersion, document.data, ()),
+            (
+                "new_asset_version",
+                exceptions.DeletedVersion,
+                document.new_asset_version,
+                (
+                    "0034-8910-rsp-48-2-0275-v2.gif",
+                    "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-v2.gif",
+                ),
+            ),
+            (
+                "new_deleted_version",
+                exceptions.VersionAlreadySet,
+                document.new_deleted_version,
+                (),
+            ),
+        ]:
+            with self.subTest(name=name):
+                self.assertRaises(exc, func, *args)
 
 
 class BundleManifestTest(UnittestMixin, unittest.TestCase):
@@ -534,29 +744,24 @@ class BundleManifestTest(UnittestMixin, unittest.TestCase):
         documents_bundle = new_bundle("0034-8910-rsp-48-2")
         current_updated = documents_bundle["updated"]
         documents_bundle = domain.BundleManifest.set_metadata(
-            documents_bundle, "publication_year", "2018"
+            documents_bundle, "publication_year", "2018", now=fake_later_utcnow
         )
         self.assertTrue(current_updated < documents_bundle["updated"])
 
     def test_set_metadata_to_preexisting_set(self):
         documents_bundle = new_bundle("0034-8910-rsp-48-2")
         documents_bundle = domain.BundleManifest.set_metadata(
-            documents_bundle,
-            "publication_year",
-            "2018",
-            now=lambda: "2018-08-05T22:33:49.795151Z",
+            documents_bundle, "publication_year", "2018", now=fake_utcnow
         )
         self.assertEqual(
             documents_bundle["metadata"]["publication_year"], "2018")
-        self.assertEqual(
-            documents_bundle["updated"], "2018-08-05T22:33:49.795151Z")
+        self.assertEqual(documents_bundle["updated"], FAKE_NOW)
 
         documents_bundle = domain.BundleManifest.set_metadata(
-            documents_bundle, "volume", "25", now=lambda: "2018-08-05T22:34:07.795151Z"
+            documents_bundle, "volume", "25", now=fake_later_utcnow
         )
 
-        self.assertEqual(
-            documents_bundle["updated"], "2018-08-05T22:34:07.795151Z")
+        self.assertEqual(documents_bundle["updated"], FAKE_LATER)
         self.assertEqual(len(documents_bundle["metadata"]), 2)
 
     def test_get_metadata(self):
@@ -611,7 +816,7 @@ class BundleManifestTest(UnittestMixin, unittest.TestCase):
         bundle = new_bundle("0034-8910-rsp-48-2")
         current_updated = bundle["updated"]
         bundle = domain.BundleManifest.set_component(
-            bundle, "component-1", "component-1"
+            bundle, "component-1", "component-1", now=fake_later_utcnow
         )
         self.assertTrue(current_updated < bundle["updated"])
 
@@ -672,18 +877,13 @@ class BundleManifestTest(UnittestMixin, unittest.TestCase):
 
     def test_get_item(self):
         bundle = new_bundle("0034-8910-rsp-48-2")
-        item = {"id": "0034-8910-rsp-48-2-0275"}
+        item = {"id": DOC_ID}
 
         self.assertEqual([], bundle["items"])
-        self.assertIsNone(
-            domain.BundleManifest.get_item(bundle, "0034-8910-rsp-48-2-0275")
-        )
+        self.assertIsNone(domain.BundleManifest.get_item(bundle, DOC_ID))
 
         bundle = domain.BundleManifest.add_item(bundle, item)
-        self.assertEqual(
-            item, domain.BundleManifest.get_item(
-                bundle, "0034-8910-rsp-48-2-0275")
-        )
+        self.assertEqual(item, domain.BundleManifest.get_item(bundle, DOC_ID))
 
     def test_add_item(self):
         documents_bundle = new_bundle("0034-8910-rsp-48-2")
@@ -830,6 +1030,51 @@ class BundleManifestTest(UnittestMixin, unittest.TestCase):
         self.assertEqual(0, len(documents_bundle["items"]))
         self.assertEqual(current_updated, documents_bundle["updated"])
 
+    def test_add_items(self):
+        documents_bundle = new_bundle("0034-8910-rsp-48-2")
+        current_updated = documents_bundle["updated"]
+        documents_bundle = domain.BundleManifest.add_items(
+            documents_bundle,
+            [
+                {"id": "/documents/0034-8910-rsp-48-2-0275"},
+                [("id", "/documents/0034-8910-rsp-48-2-0276")],
+            ],
+        )
+        self.assertEqual(
+            [
+                {"id": "/documents/0034-8910-rsp-48-2-0275"},
+                {"id": "/documents/0034-8910-rsp-48-2-0276"},
+            ],
+            documents_bundle["items"],
+        )
+        self.assertTrue(current_updated < documents_bundle["updated"])
+
+    def test_add_items_raises_exception_if_ids_repeat_within_the_batch(self):
+        documents_bundle = new_bundle("0034-8910-rsp-48-2")
+        self._assert_raises_with_message(
+            exceptions.AlreadyExists,
+            'cannot add item "/documents/0034-8910-rsp-48-2-0275" in bundle: '
+            "the item id already exists",
+            domain.BundleManifest.add_items,
+            documents_bundle,
+            [
+                {"id": "/documents/0034-8910-rsp-48-2-0275"},
+                {"id": "/documents/0034-8910-rsp-48-2-0275"},
+            ],
+        )
+        self.assertEqual([], documents_bundle["items"])
+
+    def test_add_items_raises_exception_if_an_item_has_no_id(self):
+        documents_bundle = new_bundle("0034-8910-rsp-48-2")
+        self._assert_raises_with_message(
+            KeyError,
+            "'cannot add this item \"{}\": item must contain id key'",
+            domain.BundleManifest.add_items,
+            documents_bundle,
+            [{"id": "/documents/0034-8910-rsp-48-2-0275"}, {}],
+        )
+        self.assertEqual([], documents_bundle["items"])
+
     def test_add_item_save_the_item_as_dict(self):
         bundle_manifest = new_bundle("0034-8910-rsp-48-2")
         bundle_manifest = domain.BundleManifest.add_item(
@@ -841,17 +1086,7 @@ class BundleManifestTest(UnittestMixin, unittest.TestCase):
         )
 
 
-class DocumentsBundleTest(UnittestMixin, unittest.TestCase):
-    def setUp(self):
-        datetime_patcher = mock.patch.object(
-            domain, "datetime", mock.Mock(wraps=datetime.datetime)
-        )
-        mocked_datetime = datetime_patcher.start()
-        mocked_datetime.utcnow.return_value = datetime.datetime(
-            2018, 8, 5, 22, 33, 49, 795151
-        )
-        self.addCleanup(datetime_patcher.stop)
-
+class DocumentsBundleTest(UnittestMixin, FakeDatetimeMixin, unittest.TestCase):
     def test_manifest_is_generated_on_init(self):
         documents_bundle = domain.DocumentsBundle(id="0034-8910-rsp-48-2")
         self.assertTrue(isinstance(documents_bundle.manifest, dict))
@@ -1167,16 +1402,14 @@ class DocumentsBundleTest(UnittestMixin, unittest.TestCase):
         )
 
 
-class JournalTest(UnittestMixin, unittest.TestCase):
-    def setUp(self):
-        datetime_patcher = mock.patch.object(
-            domain, "datetime", mock.Mock(wraps=datetime.datetime)
-        )
-        mocked_datetime = datetime_patcher.start()
-        mocked_datetime.utcnow.return_value = datetime.datetime(
-            2018, 8, 5, 22, 33, 49, 795151
-        )
-        self.addCleanup(datetime_patcher.stop)
+class JournalTest(
+    UnittestMixin, SharedInstanceMixin, FakeDatetimeMixin, unittest.TestCase
+):
+    @classmethod
+    def make_shared_instance(cls):
+        # periódico recém-criado, usado pelos testes que apenas consultam os
+        # valores padrão.
+        return domain.Journal(id="0034-8910-rsp-48-2")
 
     def test_manifest_is_generated_on_init(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
@@ -1196,6 +1429,15 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         self.assertEqual(journal.id(), "0034-8910-rsp-48-2")
 
+    def test_metadata_getters_return_copies(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal.mission = [{"language": "pt", "value": "Missão"}]
+
+        journal.mission[0]["value"] = "Alterada"
+        journal.mission.append({"language": "en", "value": "Mission"})
+
+        self.assertEqual(journal.mission, [{"language": "pt", "value": "Missão"}])
+
     def test_set_mission(self):
         documents_bundle = domain.Journal(id="0034-8910-rsp-48-2")
 
@@ -1262,103 +1504,80 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         )
 
     def test_title_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.title, "")
 
     def test_set_title(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.title = "Rev. Saúde Pública"
 
-        self.assertEqual(journal.title, "Rev. Saúde Pública")
-        self.assertEqual(
-            journal.manifest["metadata"]["title"], "Rev. Saúde Pública",
-        )
+        self._assert_metadata_roundtrip(journal, "title", "Rev. Saúde Pública")
 
     def test_title_iso_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.title_iso, "")
 
     def test_set_title_iso(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.title_iso = "Rev. Saúde Pública"
 
-        self.assertEqual(journal.title_iso, "Rev. Saúde Pública")
-        self.assertEqual(
-            journal.manifest["metadata"]["title_iso"], "Rev. Saúde Pública",
-        )
+        self._assert_metadata_roundtrip(journal, "title_iso", "Rev. Saúde Pública")
 
     def test_short_title_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.short_title, "")
 
     def test_set_short_title(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.short_title = "Rev. Saúde Pública"
 
-        self.assertEqual(journal.short_title, "Rev. Saúde Pública")
-        self.assertEqual(
-            journal.manifest["metadata"]["short_title"], "Rev. Saúde Pública",
-        )
+        self._assert_metadata_roundtrip(journal, "short_title", "Rev. Saúde Pública")
 
     def test_acronym_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.acronym, "")
 
     def test_set_acronym_slug(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.acronym = "rsp"
-        self.assertEqual(journal.acronym, "rsp")
-        self.assertEqual(
-            journal.manifest["metadata"]["acronym"], "rsp",
-        )
+        self._assert_metadata_roundtrip(journal, "acronym", "rsp")
 
     def test_scielo_issn_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.scielo_issn, "")
 
     def test_set_scielo_issn(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.scielo_issn = "1809-4392"
-        self.assertEqual(journal.scielo_issn, "1809-4392")
-        self.assertEqual(
-            journal.manifest["metadata"]["scielo_issn"], "1809-4392",
-        )
+        self._assert_metadata_roundtrip(journal, "scielo_issn", "1809-4392")
 
     def test_print_issn_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.print_issn, "")
 
     def test_set_print_issn(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.print_issn = "1809-4392"
-        self.assertEqual(journal.print_issn, "1809-4392")
-        self.assertEqual(
-            journal.manifest["metadata"]["print_issn"], "1809-4392",
-        )
+        self._assert_metadata_roundtrip(journal, "print_issn", "1809-4392")
 
     def test_electronic_issn_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.electronic_issn, "")
 
     def test_set_electronic_issn(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.electronic_issn = "1809-4392"
-        self.assertEqual(journal.electronic_issn, "1809-4392")
-        self.assertEqual(
-            journal.manifest["metadata"]["electronic_issn"], "1809-4392",
-        )
+        self._assert_metadata_roundtrip(journal, "electronic_issn", "1809-4392")
 
     def test_status_is_empty_list(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.status_history, [])
 
     def test_set_status(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.status_history = [{"status": "current"}]
-        self.assertEqual(journal.status_history, [{"status": "current"}])
-        self.assertEqual(
-            journal.manifest["metadata"]["status_history"], [
-                {"status": "current"}],
+        self._assert_metadata_roundtrip(
+            journal, "status_history", [{"status": "current"}]
         )
 
     def test_get_created(self):
@@ -1396,21 +1615,9 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             "Human Sciences",
             "Linguistics, Letters and Arts",
         ]
-        self.assertEqual(
-            journal.subject_areas,
-            (
-                "Agricultural Sciences",
-                "Applied Social Sciences",
-                "Biological Sciences",
-                "Engineering",
-                "Exact and Earth Sciences",
-                "Health Sciences",
-                "Human Sciences",
-                "Linguistics, Letters and Arts",
-            ),
-        )
-        self.assertEqual(
-            journal.manifest["metadata"]["subject_areas"],
+        self._assert_metadata_roundtrip(
+            journal,
+            "subject_areas",
             (
                 "Agricultural Sciences",
                 "Applied Social Sciences",
@@ -1458,6 +1665,19 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             subject_areas,
         )
 
+    def test_set_subject_areas_with_unhashable_items_raises_value_error(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        subject_areas = ["Engineering", {"a": 1}]
+        self._assert_raises_with_message(
+            ValueError,
+            "cannot set subject_areas with value %s: " % repr(tuple(subject_areas))
+            + "%s are not valid" % repr([{"a": 1}]),
+            setattr,
+            journal,
+            "subject_areas",
+            subject_areas,
+        )
+
     def test_set_subject_areas_content_raises_value_error_for_string(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         subject_areas = "LINGUISTIC, LITERATURE AND ARTS"
@@ -1483,19 +1703,9 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             },
         )
 
-        self.assertEqual(
-            journal.sponsors,
-            (
-                {
-                    "name": "FAPESP",
-                    "url": "http://www.fapesp.br/",
-                    "logo_path": "fixtures/imgs/fapesp.png",
-                },
-            ),
-        )
-
-        self.assertEqual(
-            journal.manifest["metadata"]["sponsors"],
+        self._assert_metadata_roundtrip(
+            journal,
+            "sponsors",
             (
                 {
                     "name": "FAPESP",
@@ -1530,7 +1740,7 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         )
 
     def test_metrics_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.metrics, {})
 
     def test_set_metrics(self):
@@ -1540,16 +1750,9 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             "google": {"total_h5": 10, "h5_median": 5, "h5_year": 2018},
             "scielo": "valor medio",
         }
-        self.assertEqual(
-            journal.metrics,
-            {
-                "scimago": {"url": "http://scimago.org", "title": "Scimago"},
-                "google": {"total_h5": 10, "h5_median": 5, "h5_year": 2018},
-                "scielo": "valor medio",
-            },
-        )
-        self.assertEqual(
-            journal.manifest["metadata"]["metrics"],
+        self._assert_metadata_roundtrip(
+            journal,
+            "metrics",
             {
                 "scimago": {"url": "http://scimago.org", "title": "Scimago"},
                 "google": {"total_h5": 10, "h5_median": 5, "h5_year": 2018},
@@ -1575,10 +1778,17 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             "Human Sciences Psychology",
             "Psychoanalysis",
         ]
-        journal.subject_categories = categories
-        self.assertEqual(
-            journal.manifest["metadata"]["subject_categories"], categories,
-        )
+        for value, expected in [
+            (categories, categories),
+            ("Health Sciences", list("Health Sciences")),
+            (tuple(categories[:2]), categories[:2]),
+            (fibonacci(10), ["0", "1", "1", "2", "3", "5", "8"]),
+        ]:
+            with self.subTest(value=value):
+                journal.subject_categories = value
+                self.assertEqual(
+                    journal.manifest["metadata"]["subject_categories"], expected
+                )
 
     def test_set_int_subject_categories_content_raises_type_error(self):
         journal = domain.Journal(id="0234-8410-bjmbr-587-90")
@@ -1593,70 +1803,16 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             invalid,
         )
 
-    def test_set_str_subject_categories(self):
-        journal = domain.Journal(id="0234-8410-bjmbr-587-90")
-        categories = "Health Sciences"
-        journal.subject_categories = categories
-        self.assertEqual(
-            journal.manifest["metadata"]["subject_categories"], list(
-                categories),
-        )
-
-    def test_set_tuple_subject_categories(self):
-        journal = domain.Journal(id="0234-8410-bjmbr-587-90")
-        categories = ("Health Sciences Orthopedics",
-                      "Human Sciences Psychology")
-        journal.subject_categories = categories
-        self.assertEqual(
-            journal.manifest["metadata"]["subject_categories"], list(
-                categories),
-        )
-
-    def test_set_list_like_object_to_subject_categories(self):
-        journal = domain.Journal(id="0234-8410-bjmbr-587-90")
-
-        class Fibonacci:
-            def __init__(self, maximo=1000000):
-                self.current, self.p_element = 0, 1
-                self.maximo = maximo
-
-            def __iter__(self):
-                return self
-
-            def __next__(self):
-                if self.current > self.maximo:
-                    raise StopIteration
-
-                ret = self.current
-
-                self.current, self.p_element = (
-                    self.p_element,
-                    self.current + self.p_element,
-                )
-
-                return str(ret)
-
-        fib_obj = Fibonacci(maximo=10)
-
-        journal.subject_categories = fib_obj
-        self.assertEqual(
-            journal.manifest["metadata"]["subject_categories"],
-            ["0", "1", "1", "2", "3", "5", "8"],
-        )
-
     def test_institution_responsible_for_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.institution_responsible_for, ())
 
     def test_set_institution_responsible_for(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.institution_responsible_for = ("Usp", "Scielo")
 
-        self.assertEqual(journal.institution_responsible_for,
-                         ("Usp", "Scielo"))
-        self.assertEqual(
-            journal.manifest["metadata"]["institution_responsible_for"],
-            ("Usp", "Scielo"),
+        self._assert_metadata_roundtrip(
+            journal, "institution_responsible_for", ("Usp", "Scielo")
         )
 
     def test_set_institution_responsible_for_content_raises_type_error(self):
@@ -1682,65 +1838,60 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         url = "http://mc04.manuscriptcentral.com/rsp-scielo"
         journal.online_submission_url = url
-        self.assertEqual(journal.online_submission_url, url)
-        self.assertEqual(
-            journal.manifest["metadata"]["online_submission_url"], url)
+        self._assert_metadata_roundtrip(journal, "online_submission_url", url)
 
     def test_online_submission_url_default_is_empty(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.online_submission_url, "")
 
-    def test_set_next_journal(self):
-        journal = domain.Journal(id="0034-8910-MR")
-        next_journal = {"title": "Materials Research",
-                        "id": "journal/0034-8910"}
-        journal.next_journal = next_journal
-        self.assertEqual(
-            journal.manifest["metadata"]["next_journal"], next_journal,
-        )
-
-    def test_set_str_to_next_journal_should_raise_type_error(self):
-        journal = domain.Journal(id="0034-8910-MR")
-        invalid = "name"
-        self._assert_raises_with_message(
-            TypeError,
-            "cannot set next_journal with value "
-            '"%s": value must be dict' % repr(invalid),
-            setattr,
-            journal,
-            "next_journal",
-            invalid,
-        )
-
-    def test_set_int_to_next_journal_should_raise_type_error(self):
-        journal = domain.Journal(id="0034-8910-MR")
-        invalid = 10
-        self._assert_raises_with_message(
-            TypeError,
-            "cannot set next_journal with value "
-            '"%s": value must be dict' % repr(invalid),
-            setattr,
-            journal,
-            "next_journal",
-            invalid,
-        )
-
-    def test_set_tuple_to_next_journal_should_raise_type_error(self):
-        journal = domain.Journal(id="0034-8910-MR")
-        invalid = ("item 1", "item 2")
-        self._assert_raises_with_message(
-            TypeError,
-            "cannot set next_journal with value "
-            '"%s": value must be dict' % repr(invalid),
-            setattr,
-            journal,
-            "next_journal",
-            invalid,
-        )
-
-    def test_next_journal_return_empty_dict(self):
+    def test_set_dict_metadata(self):
+        for attr, value in [
+            (
+                "next_journal",
+                {"title": "Materials Research", "id": "journal/0034-8910"},
+            ),
+            (
+                "previous_journal",
+                {"title": "Título Anterior", "id": "ID título anterior"},
+            ),
+            (
+                "contact",
+                {
+                    "name": "Faculdade de Saúde Pública da Universidade de São Paulo",
+                    "country": "Brasil",
+                    "state": "SP",
+                    "city": "São Paulo",
+                    "address": "Avenida Dr. Arnaldo, 715\n01246-904 São Paulo SP Brazil",
+                    "phone_number": "+55 11 3061-7985",
+                    "email": "revsp@usp.br",
+                    "enable_contact": "true",
+                },
+            ),
+        ]:
+            with self.subTest(attr=attr):
+                journal = domain.Journal(id="0034-8910-rsp-48-2")
+                setattr(journal, attr, value)
+                self._assert_metadata_roundtrip(journal, attr, value)
+
+    def test_dict_metadata_default_is_empty(self):
+        journal = self.shared_instance
+        for attr in ["next_journal", "previous_journal", "contact"]:
+            with self.subTest(attr=attr):
+                self.assertEqual(getattr(journal, attr), {})
+
+    def test_set_non_dict_to_next_journal_should_raise_type_error(self):
         journal = domain.Journal(id="0034-8910-MR")
-        self.assertEqual(journal.next_journal, {})
+        for invalid in ["name", 10, ("item 1", "item 2")]:
+            with self.subTest(invalid=invalid):
+                self._assert_raises_with_message(
+                    TypeError,
+                    "cannot set next_journal with value "
+                    '"%s": value must be dict' % repr(invalid),
+                    setattr,
+                    journal,
+                    "next_journal",
+                    invalid,
+                )
 
     def test_next_journal_return_raise_key_error_metadata(self):
         journal = domain.Journal(id="0034-8910-MR")
@@ -1748,19 +1899,6 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         with self.assertRaises(KeyError):
             journal.manifest["metadata"]["next_journal"]
 
-    def test_set_previous_journal(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
-        expected = {"title": "Título Anterior", "id": "ID título anterior"}
-        journal.previous_journal = expected
-        self.assertEqual(journal.previous_journal, expected)
-        self.assertEqual(
-            journal.manifest["metadata"]["previous_journal"], expected,
-        )
-
-    def test_previous_journal_default_is_empty(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
-        self.assertEqual(journal.previous_journal, {})
-
     def test_status_history(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.status_history = [{"status": "CURRENT"}]
@@ -1775,30 +1913,6 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         journal.status_history = [{"status": "CEASED"}]
         self.assertEqual(journal.status_history, [{"status": "CEASED"}])
 
-    def test_contact_is_empty_list(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
-        self.assertEqual(journal.contact, {})
-
-    def test_set_contact(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
-
-        data_journal = {
-            "name": "Faculdade de Saúde Pública da Universidade de São Paulo",
-            "country": "Brasil",
-            "state": "SP",
-            "city": "São Paulo",
-            "address": "Avenida Dr. Arnaldo, 715\n01246-904 São Paulo SP Brazil",
-            "phone_number": "+55 11 3061-7985",
-            "email": "revsp@usp.br",
-            "enable_contact": "true",
-        }
-
-        journal.contact = data_journal
-        self.assertEqual(journal.contact, data_journal)
-        self.assertEqual(
-            journal.manifest["metadata"]["contact"], data_journal,
-        )
-
     def test_set_contact_content_is_not_validated(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         self._assert_raises_with_message(
@@ -1826,17 +1940,47 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             {"id": "0034-8910-rsp-48-2"},
         )
 
-    def test_insert_issue(self):
+    def test_add_issues(self):
         journal = domain.Journal(id="0034-8910-rsp")
-        input_expected = [
-            (0, {"id": "0034-8910-rsp-48-2"}, 0),
-            (1, {"id": "0034-8910-rsp-48-3"}, 1),
-            (10, {"id": "0034-8910-rsp-48-4"}, -1),
-        ]
-        for index, issue, expected in input_expected:
-            with self.subTest(index=index, issue=issue, expected=expected):
+        journal.add_issue({"id": "0034-8910-rsp-48-1"})
+        journal.add_issues([{"id": "0034-8910-rsp-48-2"}, {"id": "0034-8910-rsp-48-3"}])
+        self.assertEqual(
+            [
+                {"id": "0034-8910-rsp-48-1"},
+                {"id": "0034-8910-rsp-48-2"},
+                {"id": "0034-8910-rsp-48-3"},
+            ],
+            journal.issues,
+        )
+
+    def test_add_issues_raises_exception_if_item_already_exists(self):
+        journal = domain.Journal(id="0034-8910-rsp")
+        journal.add_issue({"id": "0034-8910-rsp-48-2"})
+        self._assert_raises_with_message(
+            exceptions.AlreadyExists,
+            'cannot add item "0034-8910-rsp-48-2" in bundle: '
+            "the item id already exists",
+            journal.add_issues,
+            [{"id": "0034-8910-rsp-48-3"}, {"id": "0034-8910-rsp-48-2"}],
+        )
+        self.assertEqual([{"id": "0034-8910-rsp-48-2"}], journal.issues)
+
+    def test_insert_issue(self):
+        first, second, third = (
+            {"id": "0034-8910-rsp-48-2"},
+            {"id": "0034-8910-rsp-48-3"},
+            {"id": "0034-8910-rsp-48-4"},
+        )
+        for existing, index, issue, expected in [
+            ([], 0, first, [first]),
+            ([first], 1, second, [first, second]),
+            ([first, second], 10, third, [first, second, third]),
+        ]:
+            with self.subTest(index=index, issue=issue):
+                journal = domain.Journal(id="0034-8910-rsp")
+                journal.add_issues(existing)
                 journal.insert_issue(index, issue)
-                self.assertEqual(issue, journal.manifest["items"][expected])
+                self.assertEqual(expected, journal.manifest["items"])
 
     def test_insert_issue_shifts_item_in_current_position(self):
         journal = domain.Journal(id="0034-8910-rsp")
@@ -1875,9 +2019,13 @@ class JournalTest(UnittestMixin, unittest.TestCase):
 
     def test_remove_issue(self):
         journal = domain.Journal(id="0034-8910-rsp")
-        journal.add_issue({"id": "0034-8910-rsp-48-2"})
-        journal.add_issue({"id": "0034-8910-rsp-48-3"})
-        journal.add_issue({"id": "0034-8910-rsp-48-4"})
+        journal.add_issues(
+            [
+                {"id": "0034-8910-rsp-48-2"},
+                {"id": "0034-8910-rsp-48-3"},
+                {"id": "0034-8910-rsp-48-4"},
+            ]
+        )
         journal.remove_issue("0034-8910-rsp-48-3")
         self.assertEqual(
             [{"id": "0034-8910-rsp-48-2"}, {"id": "0034-8910-rsp-48-4"}],
@@ -1915,11 +2063,11 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         )
 
     def test_get_issues_should_be_empty(self):
-        journal = domain.Journal(id="0034-8910-rsp")
+        journal = self.shared_instance
         self.assertEqual([], journal.issues)
 
     def test_provisional_is_empty_str(self):
-        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal = self.shared_instance
         self.assertEqual(journal.provisional, "")
 
     def test_set_provisional(self):
@@ -1934,7 +2082,7 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         self.assertEqual("0034-8910-rsp-aop", journal.manifest["aop"])
 
     def test_ahead_of_print_bundle_return_empty_str(self):
-        journal = domain.Journal(id="0034-8910-MR")
+        journal = self.shared_instance
         self.assertEqual(journal.ahead_of_print_bundle, "")
 
     def test_remove_ahead_of_print_bundle(self):
@@ -1953,11 +2101,11 @@ class JournalTest(UnittestMixin, unittest.TestCase):
         )
 
     def test_should_have_a_data_method(self):
-        journal = domain.Journal(id="0034-8910-MR")
+        journal = self.shared_instance
         self.assertIsNotNone(journal.data())
 
     def test_should_has_an_empty_metadata(self):
-        journal = domain.Journal(id="0034-8910-MR")
+        journal = self.shared_instance
         self.assertEqual(journal.data()["metadata"], {})
 
     def test_should_return_latest_metadata_version(self):
@@ -1972,16 +2120,33 @@ class JournalTest(UnittestMixin, unittest.TestCase):
                          ["title"], "Ciência Agrária 2")
 
 
+class FailingFunction:
+    """Função que, a cada chamada, lança ou retorna o próximo item de
+    `results`, conforme seja uma exceção ou não. Registra apenas o número de
+    chamadas, que é o que os testes de `retry_gracefully` verificam.
+    """
+
+    def __init__(self, *results):
+        self.__qualname__ = "failing_function"
+        self.call_count = 0
+        self._results = iter(results)
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        result = next(self._results)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
 class RetryGracefullyDecoratorTests(unittest.TestCase):
     def test_max_retries(self):
         retry_gracefully = domain.retry_gracefully(
             max_retries=2, backoff_factor=0.001)
 
-        failing_obj = mock.Mock(
-            side_effect=[exceptions.RetryableError(
-            ), exceptions.RetryableError(), True]
+        failing_obj = FailingFunction(
+            exceptions.RetryableError(), exceptions.RetryableError(), True
         )
-        failing_obj.__qualname__ = "failing_function"
         decorated_obj = retry_gracefully(failing_obj)
         self.assertEqual(decorated_obj(), True)
         self.assertEqual(failing_obj.call_count, 3)
@@ -1993,10 +2158,7 @@ class RetryGracefullyDecoratorTests(unittest.TestCase):
             exc_list=(exceptions.RetryableError, TypeError),
         )
 
-        failing_obj = mock.Mock(
-            side_effect=[TypeError(), exceptions.RetryableError(), True]
-        )
-        failing_obj.__qualname__ = "failing_function"
+        failing_obj = FailingFunction(TypeError(), exceptions.RetryableError(), True)
         decorated_obj = retry_gracefully(failing_obj)
         self.assertEqual(decorated_obj(), True)
         self.assertEqual(failing_obj.call_count, 3)
@@ -2014,11 +2176,9 @@ class RetryGracefullyDecoratorTests(unittest.TestCase):
             max_retries=2, backoff_factor=1.2)
         retry_gracefully._sleep = mock.MagicMock(return_value=None)
 
-        failing_obj = mock.Mock(
-            side_effect=[exceptions.RetryableError(
-            ), exceptions.RetryableError(), True]
+        failing_obj = FailingFunction(
+            exceptions.RetryableError(), exceptions.RetryableError(), True
         )
-        failing_obj.__qualname__ = "failing_function"
         decorated_obj = retry_gracefully(failing_obj)
         self.assertEqual(decorated_obj(), True)
 
@@ -2026,10 +2186,56 @@ class RetryGracefullyDecoratorTests(unittest.TestCase):
         retry_gracefully._sleep.assert_has_calls(calls)
 
 
-class MetadataWithStylesForArticleWithTransTitlesTests(unittest.TestCase):
+TRANS_TITLES_DISPLAY_FORMAT = {
+    "article_title": {
+        "pt": (
+            "Uma Reflexão de Professores sobre Demonstrações "
+            "Relativas à Irracionalidade de "
+            '<inline-formula><mml:math display="inline" id="m1">'
+            "<mml:mrow><mml:msqrt><mml:mn>2</mml:mn></mml:msqrt>"
+            "</mml:mrow></mml:math></inline-formula>"
+        ),
+        "en": (
+            "Teachers' Considerations on the Irrationality Proof "
+            'of <inline-formula><mml:math display="inline" '
+            'id="m2">'
+            "<mml:mrow><mml:msqrt><mml:mn>2</mml:mn></mml:msqrt>"
+            "</mml:mrow></mml:math></inline-formula>"
+        ),
+        "es": (
+            'Español <inline-formula><mml:math display="inline" '
+            'id="m2"><mml:mrow><mml:msqrt><mml:mn>2</mml:mn>'
+            "</mml:msqrt></mml:mrow></mml:math></inline-formula>"
+        ),
+    }
+}
+
+
+SUBARTICLES_DISPLAY_FORMAT = {
+    "article_title": {
+        "en": (
+            "Heparin solution in the prevention of occlusions "
+            "in Hickman<sup>®</sup> catheters a randomized "
+            "clinical trial"
+        ),
+        "pt": (
+            "Solução de <b>heparina</b> na prevenção de oclusão do "
+            "Cateter de Hickman<sup>®</sup> ensaio clínico "
+            "randomizado"
+        ),
+        "es": (
+            "Solución <i>de heparina para prevenir</i> oclusiones en "
+            "catéteres de Hickman<sup>®</sup> un ensayo clínico "
+            "aleatorizado"
+        ),
+    }
+}
+
 
-    def setUp(self):
-        self.xml = (
+class MetadataWithStylesForArticleWithTransTitlesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.xml = (
             '<article xmlns:mml="http://www.w3.org/1998/Math/MathML" xmlns:xlink="http://www.w3.org/1999/xlink" article-type="research-article" dtd-version="1.1" specific-use="sps-1.9" xml:lang="pt">'
             '<front>'
             '<article-meta>'
@@ -2048,35 +2254,15 @@ class MetadataWithStylesForArticleWithTransTitlesTests(unittest.TestCase):
         ).encode("utf-8")
 
     def test_display_format(self):
-        result = domain.display_format(self.xml)
-        expected = {
-            "article_title": {
-                "pt":
-                    ('Uma Reflexão de Professores sobre Demonstrações '
-                        'Relativas à Irracionalidade de '
-                        '<inline-formula><mml:math display="inline" id="m1">'
-                        '<mml:mrow><mml:msqrt><mml:mn>2</mml:mn></mml:msqrt>'
-                        '</mml:mrow></mml:math></inline-formula>'),
-                "en": (
-                    """Teachers' Considerations on the Irrationality Proof """
-                    """of <inline-formula><mml:math display="inline" """
-                    """id="m2">"""
-                    """<mml:mrow><mml:msqrt><mml:mn>2</mml:mn></mml:msqrt>"""
-                    """</mml:mrow></mml:math></inline-formula>"""),
-                "es": (
-                    """Español <inline-formula><mml:math display="inline" """
-                    """id="m2"><mml:mrow><mml:msqrt><mml:mn>2</mml:mn>"""
-                    """</mml:msqrt></mml:mrow></mml:math></inline-formula>"""
-                        ),
-            }
-        }
-        self.assertEqual(expected, result)
+        self.assertEqual(
+            TRANS_TITLES_DISPLAY_FORMAT, domain.display_format(self.xml)
+        )
 
 
 class MetadataWithStylesForArticleWithSubarticlesTests(unittest.TestCase):
-
-    def setUp(self):
-        self.xml = (
+    @classmethod
+    def setUpClass(cls):
+        cls.xml = (
             '<article xmlns:mml="http://www.w3.org/1998/Math/MathML" xmlns:xlink="http://www.w3.org/1999/xlink" article-type="research-article" dtd-version="1.1" specific-use="sps-1.9" xml:lang="en">'
             '<front>'
             '<article-meta>'
@@ -2108,25 +2294,9 @@ class MetadataWithStylesForArticleWithSubarticlesTests(unittest.TestCase):
         ).encode("utf-8")
 
     def test_display_format_removes_xref(self):
-        result = domain.display_format(self.xml)
-        expected = {
-            "article_title": {
-                "en": (
-                    """Heparin solution in the prevention of occlusions """
-                    """in Hickman<sup>®</sup> catheters a randomized """
-                    """clinical trial"""
-                ),
-                "pt": (
-                    """Solução de <b>heparina</b> na prevenção de oclusão do """
-                    """Cateter de Hickman<sup>®</sup> ensaio clínico """
-                    """randomizado"""),
-                "es": (
-                    """Solución <i>de heparina para prevenir</i> oclusiones en """
-                    """catéteres de Hickman<sup>®</sup> un ensayo clínico """
-                    """aleatorizado"""),
-            }
-        }
-        self.assertDictEqual(expected, result)
+        self.assertDictEqual(
+            SUBARTICLES_DISPLAY_FORMAT, domain.display_format(self.xml)
+        )
 
     def test_display_format_removes_xref_when_have_content_between_xref(self):
         self.maxDiff = None
@@ -2162,18 +2332,11 @@ class MetadataWithStylesForArticleWithSubarticlesTests(unittest.TestCase):
         result = domain.display_format(xml)
         expected = {
             "article_title": {
+                **SUBARTICLES_DISPLAY_FORMAT["article_title"],
                 "en": (
                     """Pesquisa em ensino de química  no Brasil entre 2002 e """
                     """2017 a partir de periódicos especializados"""
                 ),
-                "pt": (
-                    """Solução de <b>heparina</b> na prevenção de oclusão do """
-                    """Cateter de Hickman<sup>®</sup> ensaio clínico """
-                    """randomizado"""),
-                "es": (
-                    """Solución <i>de heparina para prevenir</i> oclusiones en """
-                    """catéteres de Hickman<sup>®</sup> un ensayo clínico """
-                    """aleatorizado"""),
             }
         }
         self.assertDictEqual(expected, result)